@@ -21,6 +21,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--timeout", type=float, default=float(os.getenv("REQUEST_TIMEOUT", "30")))
     parser.add_argument("--retry-total", type=int, default=int(os.getenv("REQUEST_RETRY_TOTAL", "3")))
     parser.add_argument("--retry-backoff", type=float, default=float(os.getenv("REQUEST_RETRY_BACKOFF", "0.5")))
+    parser.add_argument("--concurrency", type=int, default=int(os.getenv("DOWNLOAD_CONCURRENCY", "8")), help="Parallel PDF downloads per listing page")
+    parser.add_argument("--parse-workers", type=int, default=int(os.getenv("PARSE_WORKERS", "0")), help="Worker processes for parsing listing pages (0 parses inline)")
     return parser.parse_args()
 
 
@@ -46,14 +48,19 @@ def run() -> ScrapeResult:
         retry_backoff=args.retry_backoff,
         engine=engine,
         table=args.table,
+        concurrency=args.concurrency,
+        parse_workers=args.parse_workers,
     )
 
-    result = scraper.scrape(
-        max_pages=args.pages,
-        tribunal_name=args.tribunal,
-        download_pdfs=not args.no_download,
-        persist_to_db=args.persist,
-    )
+    try:
+        result = scraper.scrape(
+            max_pages=args.pages,
+            tribunal_name=args.tribunal,
+            download_pdfs=not args.no_download,
+            persist_to_db=args.persist,
+        )
+    finally:
+        scraper.close()
 
     print(
         f"Scraped {len(result.documents)} documents | "
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from datetime import datetime
+from functools import lru_cache
+from typing import Optional
+
+
+def parse_date_text(raw: str, *, dayfirst: bool = True) -> Optional[datetime]:
+    """Parse a date string scraped from a listing into a naive `datetime`.
+
+    GOV.UK exposes ISO 8601 values in `<time datetime=...>`, so plain
+    `YYYY-MM-DD` strings are built directly and timestamps go through
+    `datetime.fromisoformat`; anything else falls back to a cached fuzzy
+    dateutil parse.
+    """
+
+    if len(raw) >= 10 and raw[4] == "-" and raw[7] == "-":
+        if len(raw) == 10 and raw[:4].isdigit() and raw[5:7].isdigit() and raw[8:].isdigit():
+            try:
+                return datetime(int(raw[:4]), int(raw[5:7]), int(raw[8:]))
+            except ValueError:
+                return None
+        try:
+            return datetime.fromisoformat(raw).replace(tzinfo=None)
+        except ValueError:
+            pass
+    return _parse_fuzzy(raw, dayfirst)
+
+
+@lru_cache(maxsize=1)
+def _dateutil_parser():
+    # dateutil is only needed for free-text dates, so import it on first use.
+    from dateutil import parser as dateparser
+
+    return dateparser.parser()
+
+
+@lru_cache(maxsize=4096)
+def _parse_fuzzy(raw: str, dayfirst: bool) -> Optional[datetime]:
+    try:
+        value = _dateutil_parser().parse(raw, dayfirst=dayfirst, fuzzy=True)
+    except (ValueError, TypeError, OverflowError):
+        return None
+    return value.replace(tzinfo=None)
@@ -6,8 +6,21 @@ from datetime import datetime
 from typing import Iterable, Optional
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from lxml import etree
+from lxml import html as lxml_html
+
+from .dates import parse_date_text
+
+_TRAILING_SLASHES_RE = re.compile(r"/+$")
+
+_ITEMS_XPATH = etree.XPath(
+    "//li[contains(concat(' ', normalize-space(@class), ' '), ' gem-c-document-list__item ')]"
+)
+_ANCHOR_XPATH = etree.XPath("(.//a[@href])[1]")
+_TIME_XPATH = etree.XPath("(.//time)[1]")
+_METADATA_ITEMS_XPATH = etree.XPath(
+    ".//ul[contains(concat(' ', normalize-space(@class), ' '), ' gem-c-document-list__item-metadata ')]//li"
+)
 
 
 @dataclass(slots=True)
@@ -30,57 +43,57 @@ def parse_listing_html(html: str, listing_url: str, *, default_domain: str = "ht
     decision date (if exposed), and any tribunal subcategory text.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
+    if not html or not html.strip():
+        return []
+
+    doc = lxml_html.document_fromstring(html)
     entries: list[ListingEntry] = []
 
-    for item in soup.select("li.gem-c-document-list__item"):
-        anchor = item.find("a", href=True)
-        if not anchor:
+    for item in _ITEMS_XPATH(doc):
+        anchors = _ANCHOR_XPATH(item)
+        if not anchors:
             continue
-        href = anchor["href"].strip()
+        anchor = anchors[0]
+        href = anchor.get("href").strip()
         absolute = urljoin(default_domain, href)
         slug = _normalise_path(absolute)
 
         decided_at = _extract_decided_at(item)
         subcategory = _extract_subcategory(item)
-        title = anchor.get_text(" ", strip=True)
+        title = _text(anchor)
 
         entries.append(ListingEntry(title=title, url=absolute, slug=slug, decided_at=decided_at, subcategory=subcategory))
 
     return entries
 
 
+def _text(element) -> str:
+    return " ".join(element.text_content().split())
+
+
 def _normalise_path(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path
-    return re.sub(r"/+$", "", path) or "/"
+    return _TRAILING_SLASHES_RE.sub("", path) or "/"
 
 
 def _extract_decided_at(item) -> Optional[datetime]:
-    time_tag = item.find("time")
-    if not time_tag:
+    time_tags = _TIME_XPATH(item)
+    if not time_tags:
         return None
-    if time_tag.has_attr("datetime") and time_tag["datetime"]:
-        raw = time_tag["datetime"].strip()
+    time_tag = time_tags[0]
+    if time_tag.get("datetime"):
+        raw = time_tag.get("datetime").strip()
     else:
-        raw = time_tag.get_text(" ", strip=True)
+        raw = _text(time_tag)
     if not raw:
         return None
-    try:
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", raw):
-            return datetime.fromisoformat(raw)
-    except ValueError:
-        pass
-    try:
-        value = dateparser.parse(raw, dayfirst=True, fuzzy=True)
-        return value.replace(tzinfo=None)
-    except (ValueError, TypeError):
-        return None
+    return parse_date_text(raw)
 
 
 def _extract_subcategory(item) -> Optional[str]:
-    for meta_item in item.select("ul.gem-c-document-list__item-metadata li"):
-        text = meta_item.get_text(" ", strip=True)
+    for meta_item in _METADATA_ITEMS_XPATH(item):
+        text = _text(meta_item)
         if not text:
             continue
         lowered = text.lower()
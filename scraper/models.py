@@ -18,6 +18,8 @@ class DocumentRecord:
     category: Optional[str] = None
     listing_url: Optional[str] = None
     metadata: dict[str, str] = field(default_factory=dict)
+    filename: Optional[str] = None
+    sha256: Optional[str] = None
 
     def as_dict(self) -> dict[str, object]:
         """Return a serialisable representation suitable for JSON/DB insertion."""
@@ -32,4 +34,6 @@ class DocumentRecord:
             "category": self.category,
             "listing_url": self.listing_url,
             "metadata": self.metadata,
+            "filename": self.filename,
+            "sha256": self.sha256,
         }
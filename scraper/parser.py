@@ -5,12 +5,32 @@ from datetime import datetime
 from typing import Iterable, List
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from dateutil import parser as dateparser
+from lxml import etree
+from lxml import html as lxml_html
 
+from .dates import parse_date_text
 from .models import DocumentRecord
 
 CASE_ID_REGEX = re.compile(r"([A-Z]{1,4}\s*\d{2,4}[/\-]\d{2,4})")
+_PDF_HREF_RE = re.compile(r"\.pdf(?=$|[?#])", re.I)
+_DATE_TEXT_RE = re.compile(r"\b\d{1,2}\s+\w+\s+\d{4}\b")
+# ASCII letters/digits map to lowercase, every other byte to "-".
+_SLUG_TABLE = bytes(
+    c + 32 if 65 <= c <= 90 else c if (97 <= c <= 122 or 48 <= c <= 57) else 45 for c in range(256)
+)
+_SLUG_DASHES_RE = re.compile(rb"-{2,}")
+
+_ARTICLES_XPATH = etree.XPath("//article")
+_ANCHORS_XPATH = etree.XPath(".//a[@href]")
+_TIME_XPATH = etree.XPath("(.//time)[1]")
+# Single libxml2 pass over the article for the first summary-like class.
+_SUMMARY_XPATH = etree.XPath(
+    "(.//*[re:test(@class, 'summary|metadata|details')])[1]",
+    namespaces={"re": "http://exslt.org/regular-expressions"},
+)
+_DL_XPATH = etree.XPath(".//dl")
+# Terms and definitions in document order; HTML allows grouping them in <div>s.
+_DL_ITEMS_XPATH = etree.XPath("./dt | ./dd | ./div/dt | ./div/dd")
 
 
 def parse_listing_html(html: str, listing_url: str, tribunal_name: str) -> List[DocumentRecord]:
@@ -21,21 +41,26 @@ def parse_listing_html(html: str, listing_url: str, tribunal_name: str) -> List[
     scraped opportunistically from definition lists or paragraph text.
     """
 
-    soup = BeautifulSoup(html, "html.parser")
+    if not html or not html.strip():
+        return []
+
+    doc = lxml_html.document_fromstring(html)
     documents: list[DocumentRecord] = []
 
-    for article in soup.find_all("article"):
-        link = _first_pdf_link(article, listing_url)
-        if not link:
+    for article in _ARTICLES_XPATH(doc):
+        anchor = _first_pdf_anchor(article)
+        if anchor is None:
             continue
+        link = urljoin(listing_url, anchor.get("href"))
 
-        title = link.get_text(strip=True) or "Housing tribunal decision"
-        case_id = _extract_case_id(article, title) or f"generated-{len(documents)+1}"
-        decision_date = _extract_date(article)
+        title = _text(anchor) or "Housing tribunal decision"
+        case_ref, date_candidates = _scan_article_text(_text(article))
+        case_id = _extract_case_id(case_ref, title) or f"generated-{len(documents)+1}"
+        decision_date = _extract_date(article, date_candidates)
 
         metadata = {}
-        summary_block = article.find(class_=re.compile("summary|metadata|details"))
-        if summary_block:
+        summary_block = _summary_block(article)
+        if summary_block is not None:
             metadata.update(_extract_key_values(summary_block))
 
         documents.append(
@@ -53,56 +78,67 @@ def parse_listing_html(html: str, listing_url: str, tribunal_name: str) -> List[
     return documents
 
 
-def _first_pdf_link(article, listing_url: str) -> str | None:
-    link = article.find("a", href=re.compile(r"\.pdf(?=$|[?#])", re.I))
-    if not link or not link.get("href"):
-        return None
-    return urljoin(listing_url, link["href"])
+def _text(element) -> str:
+    return " ".join(element.text_content().split())
+
+
+def _first_pdf_anchor(article):
+    for anchor in _ANCHORS_XPATH(article):
+        if _PDF_HREF_RE.search(anchor.get("href")):
+            return anchor
+    return None
+
 
+def _summary_block(article):
+    blocks = _SUMMARY_XPATH(article)
+    return blocks[0] if blocks else None
 
-def _extract_case_id(article, fallback: str) -> str | None:
-    text = article.get_text(" ", strip=True)
+
+def _scan_article_text(text: str) -> tuple[str | None, list[str]]:
+    # Scanned separately: a date-like run such as "1 CHI 2023" would
+    # otherwise swallow the start of the case reference that follows it.
     match = CASE_ID_REGEX.search(text)
-    if match:
-        return match.group(1).replace(" ", "")
+    return (match.group(1) if match else None), _DATE_TEXT_RE.findall(text)
+
+
+def _extract_case_id(case_ref: str | None, fallback: str) -> str | None:
+    if case_ref:
+        return case_ref.replace(" ", "")
     # fallback: generate slug from fallback text
-    slug = re.sub(r"[^A-Za-z0-9]+", "-", fallback).strip("-").lower()
-    return slug or None
-
-
-def _extract_date(article) -> datetime | None:
-    time_tag = article.find("time")
-    if time_tag and time_tag.get("datetime"):
-        try:
-            return dateparser.parse(time_tag["datetime"]).replace(tzinfo=None)
-        except (ValueError, TypeError):
-            pass
-    if time_tag and time_tag.text:
-        try:
-            return dateparser.parse(time_tag.text, dayfirst=True, fuzzy=True).replace(tzinfo=None)
-        except (ValueError, TypeError):
-            pass
+    slug = _SLUG_DASHES_RE.sub(b"-", fallback.encode("ascii", "replace").translate(_SLUG_TABLE)).strip(b"-")
+    return slug.decode("ascii") or None
+
+
+def _extract_date(article, date_candidates: Iterable[str]) -> datetime | None:
+    time_tags = _TIME_XPATH(article)
+    time_tag = time_tags[0] if time_tags else None
+    if time_tag is not None and time_tag.get("datetime"):
+        value = parse_date_text(time_tag.get("datetime"), dayfirst=False)
+        if value:
+            return value
+    if time_tag is not None and time_tag.text_content():
+        value = parse_date_text(time_tag.text_content())
+        if value:
+            return value
 
     # look for date-like text in paragraph snippets
-    for candidate in article.find_all(text=re.compile(r"\b\d{1,2}\s+\w+\s+\d{4}\b")):
-        try:
-            return dateparser.parse(candidate, dayfirst=True, fuzzy=True).replace(tzinfo=None)
-        except (ValueError, TypeError):
-            continue
+    for candidate in date_candidates:
+        value = parse_date_text(candidate)
+        if value:
+            return value
     return None
 
 
 def _extract_key_values(node) -> dict[str, str]:
     metadata: dict[str, str] = {}
 
-    definition_lists = node.find_all("dl")
-    for dl in definition_lists:
-        terms = dl.find_all("dt")
-        values = dl.find_all("dd")
-        for dt, dd in zip(terms, values):
-            key = dt.get_text(strip=True).lower().replace(" ", "_")
-            value = dd.get_text(" ", strip=True)
-            if key:
-                metadata[key] = value
+    for dl in _DL_XPATH(node):
+        key = None
+        for item in _DL_ITEMS_XPATH(dl):
+            if item.tag == "dt":
+                key = _text(item).lower().replace(" ", "_")
+            elif key:
+                metadata[key] = _text(item)
+                key = None
 
     return metadata
@@ -1,20 +1,30 @@
 from __future__ import annotations
 
 import hashlib
+import itertools
 import os
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Iterable, Iterator, List, Optional
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, TypeVar
 from urllib.parse import urlparse
 from uuid import uuid4
 
+import orjson
 from sqlalchemy import create_engine, text
-from sqlalchemy.engine import Engine
+from sqlalchemy.engine import Connection, Engine, make_url
+from sqlalchemy.exc import DBAPIError
 
 from .models import DocumentRecord
 from .parser import parse_listing_html
 from .session import build_http_session
 
+T = TypeVar("T")
+
+# PDFs up to this size are read in one go rather than streamed to disk.
+SMALL_PDF_BYTES = 2_000_000
+
 
 @dataclass
 class ScrapeResult:
@@ -37,18 +47,28 @@ class HousingTribunalScraper:
         user_agent: Optional[str] = None,
         engine: Engine | None = None,
         table: str = "dev.documents",
+        concurrency: int = 8,
+        parse_workers: int = 0,
     ) -> None:
         self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        # One blocking pool slot per download thread: workers queue for a warm
+        # keep-alive connection instead of opening throwaway ones.
         self.session = build_http_session(
             timeout=http_timeout,
             retry_total=retry_total,
             retry_backoff=retry_backoff,
             user_agent=user_agent,
+            pool_maxsize=self.concurrency,
+            pool_block=True,
         )
         self.output_dir = Path(output_dir or "outputs").resolve()
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.engine = engine
         self.table = table
+        self._conn: Connection | None = None
+        # Listing pages are parsed inline unless worker processes are requested.
+        self._parse_pool = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
 
     def scrape(
         self,
@@ -62,33 +82,61 @@ class HousingTribunalScraper:
         """Scrape listing pages and optionally download PDFs / insert metadata."""
 
         result = ScrapeResult()
+        persisting = persist_to_db and self.engine is not None
+        # URLs already in the table were downloaded and stored by an earlier run.
+        known_urls = self._known_pdf_urls() if persisting else set()
 
-        for page, documents in enumerate(self.iter_documents(max_pages=max_pages, tribunal_name=tribunal_name), start=1):
-            if not documents and stop_on_empty:
-                break
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for page, documents in enumerate(self.iter_documents(max_pages=max_pages, tribunal_name=tribunal_name), start=1):
+                if not documents and stop_on_empty:
+                    break
 
-            result.documents.extend(documents)
+                result.documents.extend(documents)
+                fresh = [doc for doc in documents if doc.document_url not in known_urls] if known_urls else documents
 
-            if download_pdfs:
-                for doc in documents:
-                    try:
-                        path = self.download_pdf(doc)
-                        result.downloaded.append(path)
-                    except Exception as exc:  # noqa: BLE001
-                        print(f"⚠️  Failed to download {doc.document_url}: {exc}")
+                if download_pdfs:
+                    result.downloaded.extend(self._download_all(pool, fresh))
 
-            if persist_to_db and self.engine:
-                inserted = self._persist_documents(documents)
-                result.db_rows_inserted += inserted
+                if persisting:
+                    inserted = self._persist_documents(fresh)
+                    result.db_rows_inserted += inserted
+                    known_urls.update(doc.document_url for doc in fresh)
 
         return result
 
+    def close(self) -> None:
+        """Release the HTTP session and the persistence connection, if open."""
+
+        self.session.close()
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(cancel_futures=True)
+            self._parse_pool = None
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _download_all(self, pool: ThreadPoolExecutor, documents: list[DocumentRecord]) -> list[Path]:
+        """Download a page's PDFs concurrently, preserving listing order."""
+
+        futures = [(doc, pool.submit(self.download_pdf, doc)) for doc in documents]
+        downloaded: list[Path] = []
+        for doc, future in futures:
+            try:
+                downloaded.append(future.result())
+            except Exception as exc:  # noqa: BLE001
+                print(f"⚠️  Failed to download {doc.document_url}: {exc}")
+        return downloaded
+
     def iter_documents(
         self,
         *,
         max_pages: Optional[int],
         tribunal_name: str,
     ) -> Iterator[List[DocumentRecord]]:
+        if self._parse_pool is not None:
+            yield from self._iter_documents_pooled(max_pages=max_pages, tribunal_name=tribunal_name)
+            return
+
         page = 1
         while True:
             if max_pages is not None and page > max_pages:
@@ -105,24 +153,96 @@ class HousingTribunalScraper:
                 break
             page += 1
 
-    def download_pdf(self, document: DocumentRecord) -> Path:
-        response = self.session.get(document.document_url, stream=True)
-        response.raise_for_status()
+    def _iter_documents_pooled(
+        self,
+        *,
+        max_pages: Optional[int],
+        tribunal_name: str,
+    ) -> Iterator[List[DocumentRecord]]:
+        """Parse pages in worker processes while the next page is being fetched."""
 
+        pages = itertools.count(1) if max_pages is None else range(1, max_pages + 1)
+        pending: Future[List[DocumentRecord]] | None = None
+        for page in pages:
+            url = self._page_url(page)
+            response = self.session.get(url)
+            future = None
+            if response.ok:
+                future = self._parse_pool.submit(parse_listing_html, response.text, url, tribunal_name)
+
+            if pending is not None:
+                documents = pending.result()
+                yield documents
+                if not documents:
+                    if future is not None:
+                        future.cancel()
+                    return
+            # Raised only now: past the last page, an error for this request
+            # must not hide the empty page that ends the listing.
+            response.raise_for_status()
+            pending = future
+
+        if pending is not None:
+            yield pending.result()
+
+    def download_pdf(self, document: DocumentRecord) -> Path:
         filename = self._filename_for(document)
         target_path = self.output_dir / filename
-        with target_path.open("wb") as fh:
-            for chunk in response.iter_content(chunk_size=64 * 1024):
-                if chunk:
-                    fh.write(chunk)
+        if target_path.is_file() and target_path.stat().st_size > 0:
+            # Already fetched by a previous run; only the digest is needed.
+            if document.sha256 is None:
+                with target_path.open("rb") as fh:
+                    document.sha256 = hashlib.file_digest(fh, "sha256").hexdigest()
+            return target_path
+        # Written under a per-call temporary name so an interrupted download is
+        # never mistaken for a complete file, and concurrent downloads of the
+        # same document never share a partial file.
+        with tempfile.NamedTemporaryFile(
+            dir=self.output_dir, prefix=f"{filename}.", suffix=".part", delete=False
+        ) as fh:
+            partial_path = Path(fh.name)
+            try:
+                with self.session.get(document.document_url, stream=True) as response:
+                    response.raise_for_status()
+                    streamed = not 0 < _content_length(response.headers) <= SMALL_PDF_BYTES
+                    digest = hashlib.sha256()
+                    if not streamed:
+                        # Typical decisions are small: one read, hashed in memory.
+                        body = response.content
+                        digest.update(body)
+                        fh.write(body)
+                    else:
+                        # Larger files are hashed as they stream to disk, so the
+                        # file is never read back just to compute its digest.
+                        for chunk in iter(lambda: response.raw.read(1 << 20, decode_content=True), b""):
+                            digest.update(chunk)
+                            fh.write(chunk)
+            except BaseException:
+                fh.close()
+                partial_path.unlink(missing_ok=True)
+                raise
+        os.replace(partial_path, target_path)
+        document.sha256 = digest.hexdigest()
+        if streamed:
+            _drop_page_cache(target_path)
         return target_path
 
-    def _persist_documents(self, documents: Iterable[DocumentRecord]) -> int:
+    def _persist_documents(self, documents: Sequence[DocumentRecord]) -> int:
         if not documents:
             return 0
         if not self.engine:
             raise RuntimeError("SQLAlchemy engine not configured")
 
+        # Rows are bulk-loaded with COPY into a per-transaction staging table
+        # and merged with one INSERT ... SELECT so ON CONFLICT still applies.
+        create_staging_sql = text(
+            f"""
+            CREATE TEMP TABLE staging_documents ON COMMIT DROP AS
+            SELECT id, case_id, pdf_url, sha256, tribunal, metadata, filename
+            FROM {self.table}
+            WITH NO DATA
+            """
+        )
         insert_sql = text(
             f"""
             INSERT INTO {self.table} (
@@ -139,46 +259,110 @@ class HousingTribunalScraper:
                 filename,
                 last_error
             )
-            VALUES (
-                :id,
-                :case_id,
-                :pdf_url,
-                :sha256,
+            SELECT
+                id,
+                case_id,
+                pdf_url,
+                sha256,
                 FALSE,
                 0,
                 NULL,
-                :tribunal,
-                CAST(:metadata AS jsonb),
+                tribunal,
+                metadata,
                 NULL,
-                :filename,
+                filename,
                 NULL
-            )
+            FROM staging_documents
             ON CONFLICT (pdf_url) DO NOTHING
             """
         )
 
-        as_list = list(documents)
-        payload = [
-            {
-                "id": str(uuid4()),
-                "case_id": doc.case_id,
-                "pdf_url": doc.document_url,
-                "sha256": _dummy_sha_placeholder(doc.document_url),
-                "tribunal": doc.tribunal,
-                "metadata": json_dumps({
-                    "case_id": doc.case_id,
+        def write(conn: Connection) -> int:
+            with conn.begin():
+                conn.execute(create_staging_sql)
+                with conn.connection.driver_connection.cursor() as cur:
+                    with cur.copy(
+                        "COPY staging_documents (id, case_id, pdf_url, sha256, tribunal, metadata, filename) FROM STDIN"
+                    ) as copy:
+                        write_row = copy.write_row
+                        for row in self._staging_rows(documents):
+                            write_row(row)
+                result = conn.execute(insert_sql)
+            return result.rowcount or 0
+
+        return self._with_connection(write)
+
+    def _staging_rows(self, documents: Iterable[DocumentRecord]) -> Iterator[tuple[object, ...]]:
+        """Yield COPY rows one document at a time so a batch is never materialised twice."""
+
+        filename_for = self._filename_for
+        for doc in documents:
+            url = doc.document_url
+            case_id = doc.case_id
+            yield (
+                str(uuid4()),
+                case_id,
+                url,
+                doc.sha256 or _dummy_sha_placeholder(url),
+                doc.tribunal,
+                json_dumps({
+                    "case_id": case_id,
                     "title": doc.title,
-                    "decision_date": doc.decision_date.isoformat() if doc.decision_date else None,
+                    "decision_date": doc.decision_date,
                     "listing_url": doc.listing_url,
                     "metadata": doc.metadata,
                 }),
-                "filename": self._filename_for(doc),
-            }
-            for doc in as_list
-        ]
-        with self.engine.begin() as conn:
-            result = conn.execute(insert_sql, payload)
-        return result.rowcount or 0
+                filename_for(doc),
+            )
+
+    def _known_pdf_urls(self) -> set[str]:
+        def read(conn: Connection) -> set[str]:
+            with conn.begin():
+                return set(conn.execute(text(f"SELECT pdf_url FROM {self.table}")).scalars())
+
+        return self._with_connection(read)
+
+    def _connection(self) -> Connection:
+        """Return the long-lived connection reused for every persisted page."""
+
+        if self._conn is None:
+            self._conn = self.engine.connect()
+            # JIT compilation only adds latency to these small statements.
+            self._conn.execute(text("SET jit = off"))
+            self._conn.commit()
+        return self._conn
+
+    def _with_connection(self, work: Callable[[Connection], T]) -> T:
+        """Run `work` on the long-lived connection, reconnecting once if it was dropped.
+
+        The pool's pre-ping only runs at checkout, and this connection is never
+        checked out again, so a server-side idle disconnect during a long
+        download phase is only noticed when the next statement fails.
+        """
+
+        try:
+            return work(self._connection())
+        except Exception as exc:
+            if not self._connection_lost(exc):
+                raise
+        self._discard_connection()
+        return work(self._connection())
+
+    def _connection_lost(self, exc: Exception) -> bool:
+        if isinstance(exc, DBAPIError):
+            return exc.connection_invalidated
+        # COPY runs on the raw driver connection, so its errors are not
+        # wrapped by SQLAlchemy; a closed driver connection means the same.
+        conn = self._conn
+        if conn is None:
+            return False
+        return conn.invalidated or conn.connection.driver_connection.closed
+
+    def _discard_connection(self) -> None:
+        if self._conn is not None:
+            self._conn.invalidate()
+            self._conn.close()
+            self._conn = None
 
     def _page_url(self, page: int) -> str:
         if "{page}" in self.base_url:
@@ -189,22 +373,56 @@ class HousingTribunalScraper:
         return f"{self.base_url}{separator}page={page}"
 
     def _filename_for(self, document: DocumentRecord) -> str:
+        if document.filename:
+            return document.filename
         parsed = urlparse(document.document_url)
-        name = os.path.basename(parsed.path)
-        if name:
-            return name
-        return f"{document.case_id}.pdf"
+        name = os.path.basename(parsed.path) or f"{document.case_id}.pdf"
+        # Different URLs often share a basename (e.g. `.../<id>/Decision.pdf`),
+        # so a short hash of the full URL keeps each one's file distinct.
+        stem, dot, suffix = name.rpartition(".")
+        url_hash = hashlib.sha256(document.document_url.encode()).hexdigest()[:12]
+        name = f"{stem}-{url_hash}.{suffix}" if dot else f"{name}-{url_hash}"
+        document.filename = name
+        return name
 
 
 def connect_engine(neon_url: str) -> Engine:
-    engine_url = neon_url
-    return create_engine(engine_url, pool_pre_ping=True)
+    # Plain postgres URLs would pick psycopg2; pin the psycopg (v3) driver from
+    # requirements.txt, which `_persist_documents` relies on for COPY.
+    if neon_url.startswith("postgres://"):
+        neon_url = "postgresql://" + neon_url[len("postgres://"):]
+    engine_url = make_url(neon_url)
+    if engine_url.drivername == "postgresql":
+        engine_url = engine_url.set(drivername="postgresql+psycopg")
+    return create_engine(
+        engine_url,
+        pool_pre_ping=True,
+        pool_size=1,
+        max_overflow=0,
+    )
 
 
 def json_dumps(payload: dict[str, object]) -> str:
-    import json
+    return orjson.dumps(payload, default=str).decode()
+
+
+def _content_length(headers) -> int:
+    try:
+        return int(headers.get("Content-Length", "0"))
+    except ValueError:
+        return 0
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Hint the kernel that a freshly written PDF will not be read back soon."""
 
-    return json.dumps(payload, default=str)
+    if not hasattr(os, "posix_fadvise"):
+        return
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
 
 
 def _dummy_sha_placeholder(source: str) -> str:
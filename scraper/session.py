@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+from datetime import timedelta
 from typing import Optional
 
 import requests
@@ -14,10 +15,23 @@ def build_http_session(
     retry_total: int = 3,
     retry_backoff: float = 0.5,
     user_agent: Optional[str] = None,
+    pool_connections: int = 16,
+    pool_maxsize: int = 64,
+    pool_block: bool = False,
+    cache_path: Optional[str] = None,
+    cache_expire_after: timedelta = timedelta(days=7),
 ) -> requests.Session:
-    """Create a `requests.Session` configured with retry/backoff logic."""
+    """Create a `requests.Session` configured with retry/backoff logic.
 
-    session = requests.Session()
+    `pool_maxsize` bounds the keep-alive connections kept per host; size it to
+    the number of threads sharing the session so connections are reused rather
+    than re-handshaked.
+
+    With `cache_path`, GET responses other than PDFs are cached in a SQLite file
+    there (requires the optional `requests-cache` package).
+    """
+
+    session = _cached_session(cache_path, cache_expire_after) if cache_path else requests.Session()
     retry = Retry(
         total=retry_total,
         connect=retry_total,
@@ -27,7 +41,12 @@ def build_http_session(
         allowed_methods=("GET", "HEAD"),
         raise_on_status=False,
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    adapter = HTTPAdapter(
+        max_retries=retry,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+    )
     session.mount("http://", adapter)
     session.mount("https://", adapter)
 
@@ -40,6 +59,28 @@ def build_http_session(
     return session
 
 
+def _cached_session(cache_path: str, expire_after: timedelta) -> requests.Session:
+    try:
+        import requests_cache
+    except ImportError as exc:
+        raise RuntimeError("HTTP caching requires the requests-cache package") from exc
+
+    return requests_cache.CachedSession(
+        cache_name=cache_path,
+        backend="sqlite",
+        expire_after=expire_after,
+        allowable_methods=("GET",),
+        cache_control=True,
+        # PDFs are hashed once on insert; caching them would only bloat the file.
+        urls_expire_after={"*.pdf": requests_cache.DO_NOT_CACHE},
+        filter_fn=_is_not_pdf,
+    )
+
+
+def _is_not_pdf(response: requests.Response) -> bool:
+    return "pdf" not in response.headers.get("Content-Type", "").lower()
+
+
 def _timeout_wrapper(func, timeout: float):
     def wrapped(method, url, **kwargs):
         if "timeout" not in kwargs:
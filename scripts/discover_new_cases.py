@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 import argparse
-import hashlib
 import json
 import os
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from typing import Sequence
@@ -15,13 +15,16 @@ from typing import Sequence
 import psycopg
 from psycopg import sql
 
+from scraper.dates import parse_date_text
 from scraper.govuk_listing import ListingEntry, parse_listing_html
 from scraper.session import build_http_session
-from scripts.find_extra_pdfs import decide_doc_metadata, derive_filename, insert_document
+from scripts.find_extra_pdfs import decide_doc_metadata, derive_filename, document_statements, flush_documents
 from scripts.rescrape_cases import (
-    download_pdf,
+    connect_db,
+    download_pdf_sha256,
     ensure_cursor_table,
     extract_pdfs_from_decision_page,
+    probe_pdf,
 )
 
 DEFAULT_LISTING_URL = "https://www.gov.uk/residential-property-tribunal-decisions"
@@ -29,6 +32,10 @@ DEFAULT_DOCUMENTS_TABLE = "dev.documents"
 DEFAULT_CASES_TABLE = "dev.cases"
 DEFAULT_CURSOR_NAME = "discover_new_cases"
 DEFAULT_MAX_PAGES_WITHOUT_NEW = 2
+DEFAULT_FETCH_CONCURRENCY = 8
+SLUG_FETCH_SIZE = 10_000
+CUTOFF_COLUMNS = ("published_at", "decision_date", "created_at")
+DEFAULT_DOWNLOAD_CONCURRENCY = 8
 
 
 @dataclass
@@ -56,10 +63,6 @@ def now_utc() -> datetime:
     return datetime.now(timezone.utc)
 
 
-def sha256_bytes(buffer: bytes) -> str:
-    return hashlib.sha256(buffer).hexdigest()
-
-
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--listing-url", default=os.getenv("LISTING_URL", DEFAULT_LISTING_URL))
@@ -75,10 +78,26 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--timeout", type=float, default=15.0, help="HTTP timeout for listing/detail fetches")
     parser.add_argument("--download-timeout", type=float, default=60.0, help="HTTP timeout for PDF downloads")
+    parser.add_argument(
+        "--fetch-concurrency",
+        type=int,
+        default=DEFAULT_FETCH_CONCURRENCY,
+        help="Decision pages fetched in parallel per listing page",
+    )
+    parser.add_argument(
+        "--download-concurrency",
+        type=int,
+        default=DEFAULT_DOWNLOAD_CONCURRENCY,
+        help="PDFs downloaded and hashed in parallel per listing page",
+    )
     parser.add_argument("--delay-ms", type=int, default=0, help="Delay between listing page fetches")
     parser.add_argument("--dry-run", action="store_true", help="Report only; do not mutate the database")
     parser.add_argument("--csv", dest="csv_path", help="Optional CSV export of newly inserted cases")
-    parser.add_argument("--docs-csv", dest="docs_csv_path", help="Optional CSV export of document rows that would be inserted")
+    parser.add_argument(
+        "--docs-csv",
+        dest="docs_csv_path",
+        help="Optional CSV export of document rows that would be inserted (dry runs HEAD the PDFs; sha256 left blank)",
+    )
     parser.add_argument("--verbose", action="store_true", help="Log each listing processed")
     parser.add_argument("--reset-cursor", action="store_true", help="Clear stored progress before running")
     parser.add_argument("--cutoff", help="Override cutoff datetime (ISO8601 or natural language)")
@@ -102,7 +121,7 @@ def parse_table_reference(name: str) -> tuple[str, str]:
     raise ValueError(f"Unexpected table reference: {name}")
 
 
-def fetch_table_columns(conn: psycopg.Connection, table_name: str) -> set[str]:
+def fetch_table_columns(conn: psycopg.Connection, table_name: str) -> frozenset[str]:
     schema, table = parse_table_reference(table_name)
     query = """
         SELECT column_name
@@ -111,14 +130,10 @@ def fetch_table_columns(conn: psycopg.Connection, table_name: str) -> set[str]:
     """
     with conn.cursor() as cur:
         cur.execute(query, (schema, table))
-        return {row[0] for row in cur.fetchall()}
+        return frozenset(row[0] for row in cur.fetchall())
 
 
-def fetch_max_column_value(conn: psycopg.Connection, table: sql.Composed, column: str) -> datetime | None:
-    query = sql.SQL("SELECT MAX({column}) FROM {table}").format(column=sql.Identifier(column), table=table)
-    with conn.cursor() as cur:
-        cur.execute(query)
-        value = cur.fetchone()[0]
+def coerce_datetime(value) -> datetime | None:
     if isinstance(value, datetime):
         return value.replace(tzinfo=None)
     if isinstance(value, date):
@@ -126,13 +141,20 @@ def fetch_max_column_value(conn: psycopg.Connection, table: sql.Composed, column
     return None
 
 
-def load_existing_slugs(conn: psycopg.Connection, cases_table: sql.Composed, slugs: Sequence[str]) -> set[str]:
-    if not slugs:
-        return set()
-    query = sql.SQL("SELECT govuk_slug FROM {table} WHERE govuk_slug = ANY(%s)").format(table=cases_table)
-    with conn.cursor() as cur:
-        cur.execute(query, (list(slugs),))
-        return {row[0] for row in cur.fetchall() if row[0]}
+def load_existing_slugs(conn: psycopg.Connection, cases_table: sql.Composed) -> frozenset[str]:
+    """Load every known slug once as a compact, read-only set.
+
+    Slugs are interned so each string is stored once; slugs discovered during
+    the run are tracked separately by the caller.
+    """
+
+    query = sql.SQL("SELECT govuk_slug FROM {table} WHERE govuk_slug IS NOT NULL").format(table=cases_table)
+    # Server-side cursor: stream the slugs in chunks instead of buffering the
+    # whole result client-side next to the set being built from it.
+    with conn.cursor(name="discover_existing_slugs") as cur:
+        cur.itersize = SLUG_FETCH_SIZE
+        cur.execute(query)
+        return frozenset(sys.intern(row[0]) for row in cur)
 
 
 def determine_cutoff(
@@ -141,13 +163,18 @@ def determine_cutoff(
     cases_table: sql.Composed,
 ) -> datetime | None:
     columns = fetch_table_columns(conn, cases_table_name)
-    candidates: list[datetime] = []
-    for column in ("published_at", "decision_date", "created_at"):
-        if column not in columns:
-            continue
-        value = fetch_max_column_value(conn, cases_table, column)
-        if value:
-            candidates.append(value)
+    present = [column for column in CUTOFF_COLUMNS if column in columns]
+    if not present:
+        return None
+    # One scan for every candidate column instead of a MAX query per column.
+    query = sql.SQL("SELECT {maxima} FROM {table}").format(
+        maxima=sql.SQL(", ").join(sql.SQL("MAX({})").format(sql.Identifier(column)) for column in present),
+        table=cases_table,
+    )
+    with conn.cursor() as cur:
+        cur.execute(query)
+        row = cur.fetchone()
+    candidates = [value for value in map(coerce_datetime, row) if value]
     if not candidates:
         return None
     return max(candidates)
@@ -166,19 +193,8 @@ def fetch_listing_entries(session, listing_url: str, page: int) -> list[ListingE
 def parse_date(value: str | None) -> datetime | None:
     if not value:
         return None
-    try:
-        parsed = datetime.fromisoformat(value)
-        return parsed.replace(tzinfo=None)
-    except ValueError:
-        from dateutil import parser as dateparser
-
-        try:
-            parsed_any = dateparser.parse(value, dayfirst=True, fuzzy=True)
-            if parsed_any:
-                return parsed_any.replace(tzinfo=None)
-        except (ValueError, TypeError):
-            return None
-    return None
+    # Shared with the listing parsers: ISO fast path plus a cached fuzzy parse.
+    return parse_date_text(value)
 
 
 def maybe_sleep(delay_ms: int):
@@ -210,26 +226,26 @@ def write_csv(path: str, rows: Sequence[CaseInsertResult]):
         return
     import csv
 
-    fieldnames = [
+    header = (
         "case_slug",
         "case_id",
         "published_at",
         "decision_date",
         "documents",
-    ]
+    )
     with open(path, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "case_slug": row.case_slug,
-                    "case_id": row.case_id,
-                    "published_at": row.published_at.isoformat() if row.published_at else "",
-                    "decision_date": row.decision_date.isoformat() if row.decision_date else "",
-                    "documents": "\n".join(row.documents),
-                }
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(
+            (
+                row.case_slug,
+                row.case_id,
+                row.published_at.isoformat() if row.published_at else "",
+                row.decision_date.isoformat() if row.decision_date else "",
+                "\n".join(row.documents),
             )
+            for row in rows
+        )
 
 
 def write_docs_csv(path: str, rows: Sequence[DocumentPreview]):
@@ -237,7 +253,7 @@ def write_docs_csv(path: str, rows: Sequence[DocumentPreview]):
         return
     import csv
 
-    fieldnames = [
+    header = (
         "case_slug",
         "pdf_url",
         "filename",
@@ -246,24 +262,24 @@ def write_docs_csv(path: str, rows: Sequence[DocumentPreview]):
         "mime",
         "document_type",
         "document_classification_method",
-    ]
+    )
 
     with open(path, "w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "case_slug": row.case_slug,
-                    "pdf_url": row.pdf_url,
-                    "filename": row.filename or "",
-                    "sha256": row.sha256 or "",
-                    "bytes": row.bytes_len or "",
-                    "mime": row.mime or "",
-                    "document_type": row.document_type or "",
-                    "document_classification_method": row.classification_method,
-                }
+        writer = csv.writer(handle)
+        writer.writerow(header)
+        writer.writerows(
+            (
+                row.case_slug,
+                row.pdf_url,
+                row.filename or "",
+                row.sha256 or "",
+                row.bytes_len or "",
+                row.mime or "",
+                row.document_type or "",
+                row.classification_method,
             )
+            for row in rows
+        )
 
 
 def upsert_case(
@@ -312,50 +328,158 @@ def upsert_case(
                 payload.get("published"),
                 payload.get("decisionDate"),
             ),
+            prepare=True,
         )
         row = cur.fetchone()
     return int(row[0]), bool(row[1])
 
 
-def process_listing_entry(
+def bulk_upsert_cases(
     conn: psycopg.Connection,
+    cases_table: sql.Composed,
+    cases: Sequence[tuple[ListingEntry, dict | None]],
+) -> dict[str, tuple[int, bool]]:
+    """Upsert a page of cases with one INSERT over `unnest`-ed column arrays.
+
+    Returns `{slug: (id, inserted)}`. Rows are de-duplicated by slug first since
+    a single `ON CONFLICT DO UPDATE` statement cannot touch the same row twice.
+    Passing one array per column keeps the SQL text identical whatever the page
+    size, so the statement is prepared once and reused for every page.
+    """
+
+    unique = {entry.slug: (entry, meta or {}) for entry, meta in cases}
+    if not unique:
+        return {}
+    columns = [[] for _ in range(7)]
+    for entry, meta in unique.values():
+        for column, value in zip(
+            columns,
+            (
+                entry.slug,
+                entry.url,
+                meta.get("title"),
+                meta.get("category"),
+                meta.get("subcategory"),
+                meta.get("published"),
+                meta.get("decisionDate"),
+            ),
+        ):
+            column.append(value)
+
+    query = sql.SQL(
+        """
+        INSERT INTO {table} (
+            govuk_slug,
+            html_url,
+            title,
+            category,
+            subcategory,
+            published_at,
+            decision_date
+        )
+        SELECT *
+        FROM unnest(
+            %s::text[], %s::text[], %s::text[], %s::text[], %s::text[],
+            %s::timestamptz[], %s::timestamptz[]
+        )
+        ON CONFLICT (govuk_slug)
+        DO UPDATE SET
+            html_url = EXCLUDED.html_url,
+            title = EXCLUDED.title,
+            category = EXCLUDED.category,
+            subcategory = EXCLUDED.subcategory,
+            published_at = EXCLUDED.published_at,
+            decision_date = EXCLUDED.decision_date,
+            updated_at = NOW()
+        RETURNING id, govuk_slug, (xmax = 0) AS inserted
+        """
+    ).format(table=cases_table)
+    with conn.cursor() as cur:
+        cur.execute(query, columns, prepare=True)
+        return {slug: (int(case_id), bool(inserted)) for case_id, slug, inserted in cur.fetchall()}
+
+
+def upsert_cases(
+    conn: psycopg.Connection,
+    cases_table: sql.Composed,
+    cases: Sequence[tuple[ListingEntry, dict | None]],
+) -> dict[str, tuple[int, bool]]:
+    """Bulk upsert a page of cases, retrying row by row if the batch fails."""
+
+    try:
+        results = bulk_upsert_cases(conn, cases_table, cases)
+        conn.commit()
+        return results
+    except Exception as exc:  # noqa: BLE001
+        print(f"! Bulk case upsert failed ({exc}); retrying one case at a time")
+        conn.rollback()
+
+    results = {}
+    for entry, meta in cases:
+        try:
+            results[entry.slug] = upsert_case(conn, cases_table, slug=entry.slug, html_url=entry.url, meta=meta)
+            conn.commit()
+        except Exception as exc:  # noqa: BLE001
+            print(f"! Error upserting {entry.slug}: {exc}")
+            conn.rollback()
+    return results
+
+
+def submit_downloads(
+    pdfs: list[dict],
+    *,
+    download_pool: ThreadPoolExecutor,
+    session,
+    timeout: float,
+    enabled: bool,
+    probe_only: bool = False,
+) -> list[tuple[dict, Future | None]]:
+    """Queue a case's PDFs for download + hashing on the shared worker pool.
+
+    With `probe_only` the PDFs are only HEAD-ed for size and type, which is
+    all a dry-run preview needs.
+    """
+
+    candidates = [pdf for pdf in pdfs if pdf.get("url")]
+    if not enabled:
+        return [(pdf, None) for pdf in candidates]
+    fetch = probe_document if probe_only else download_pdf_sha256
+    return [(pdf, download_pool.submit(fetch, pdf["url"], session, timeout=timeout)) for pdf in candidates]
+
+
+def probe_document(url: str, session, *, timeout: float) -> tuple[None, int | None, str]:
+    """`download_pdf_sha256`-shaped result from a HEAD request (no digest)."""
+
+    bytes_len, mime, _etag = probe_pdf(url, session, timeout=timeout)
+    return None, bytes_len, mime
+
+
+def process_listing_entry(
     *,
     entry: ListingEntry,
-    cases_table: sql.Composed,
-    documents_table: sql.Composed,
-    http_session,
-    download_session,
+    meta: dict | None,
+    case_id: str,
+    downloads: list[tuple[dict, Future | None]],
     dry_run: bool,
+    staged_docs: list[tuple],
     export_docs: list[DocumentPreview],
     export_docs_enabled: bool,
-) -> CaseInsertResult | None:
-    meta, pdfs = extract_pdfs_from_decision_page(entry.url, http_session)
+) -> CaseInsertResult:
+    """Collect a case's downloaded PDFs and stage their rows for the page-level COPY.
+
+    `documents` on the result lists the staged URLs; the caller narrows it to
+    the rows that were actually inserted once the page is flushed.
+    """
 
     published_str = meta.get("published") if meta else None
     published_at = parse_date(published_str)
     decision_str = meta.get("decisionDate") if meta else None
     decision_at = parse_date(decision_str)
 
-    if dry_run:
-        case_id = "dry-run"
-    else:
-        case_id_int, inserted = upsert_case(
-            conn,
-            cases_table,
-            slug=entry.slug,
-            html_url=entry.url,
-            meta=meta,
-        )
-        if not inserted:
-            return None
-        case_id = str(case_id_int)
+    staged_urls: list[str] = []
 
-    inserted_urls: list[str] = []
-
-    for pdf in pdfs:
-        url = pdf.get("url")
-        if not url:
-            continue
+    for pdf, download in downloads:
+        url = pdf["url"]
 
         document_type, classification_method = decide_doc_metadata(pdf)
         filename = derive_filename(url)
@@ -364,42 +488,21 @@ def process_listing_entry(
         bytes_len: int | None = None
         mime: str | None = None
 
-        should_download = export_docs_enabled or (not dry_run)
-        if should_download:
+        if download is not None:
             try:
-                buf, bytes_len, mime = download_pdf(url, download_session)
-                sha_hex = sha256_bytes(buf)
+                sha_hex, bytes_len, mime = download.result()
             except Exception as exc:  # noqa: BLE001
                 print(f"! Failed to download {url}: {exc}")
-                if not dry_run:
-                    conn.rollback()
                 continue
 
         if not dry_run:
             if sha_hex is None or bytes_len is None:
                 print(f"! Missing document metadata for {url}; skipping insert")
                 continue
-            try:
-                inserted = insert_document(
-                    conn,
-                    documents_table,
-                    case_id=case_id,
-                    pdf_url=url,
-                    sha256_hex=sha_hex,
-                    bytes_len=bytes_len,
-                    mime=mime,
-                    filename=filename,
-                    document_type=document_type,
-                    classification_method=classification_method,
-                )
-                if inserted:
-                    inserted_urls.append(url)
-            except Exception as exc:  # noqa: BLE001
-                print(f"! Failed to ingest document for {entry.slug}: {exc}")
-                conn.rollback()
-                continue
-        else:
-            inserted_urls.append(url)
+            staged_docs.append(
+                (case_id, url, sha_hex, bytes_len, mime, filename, document_type, classification_method)
+            )
+        staged_urls.append(url)
 
         if export_docs_enabled:
             export_docs.append(
@@ -420,7 +523,7 @@ def process_listing_entry(
         case_id=case_id,
         published_at=published_at,
         decision_date=decision_at,
-        documents=inserted_urls,
+        documents=staged_urls,
     )
 
 
@@ -430,11 +533,14 @@ def main() -> int:
     if not db_url:
         raise SystemExit("DATABASE_URL is required")
 
-    docs_table = quote_table(args.documents_table)
+    doc_sql = document_statements(quote_table(args.documents_table))
     cases_table = quote_table(args.cases_table)
 
-    http_session = build_http_session(timeout=args.timeout)
-    download_session = build_http_session(timeout=args.download_timeout)
+    # One session for listings, decision pages and PDFs so every worker shares
+    # the same keep-alive pool; downloads pass their longer timeout per call.
+    fetch_workers = max(1, args.fetch_concurrency)
+    download_workers = max(1, args.download_concurrency)
+    http_session = build_http_session(timeout=args.timeout, pool_maxsize=fetch_workers + download_workers + 1)
 
     listing_url = args.listing_url.rstrip("/")
     if listing_url.endswith(".json"):
@@ -454,10 +560,12 @@ def main() -> int:
     total_docs = 0
 
     start_ts = time.time()
+    listing_pool = ThreadPoolExecutor(max_workers=1)
+    fetch_pool = ThreadPoolExecutor(max_workers=fetch_workers)
+    download_pool = ThreadPoolExecutor(max_workers=download_workers)
 
     try:
-        with psycopg.connect(db_url) as conn:
-            conn.execute("SET SESSION statement_timeout = '5min';")
+        with connect_db(db_url, statement_timeout="5min") as conn:
             ensure_cursor_table(conn)
             if args.reset_cursor:
                 clear_cursor(conn, args.cursor_name)
@@ -469,57 +577,117 @@ def main() -> int:
             else:
                 print("No cutoff found (empty cases table).")
 
+            existing_slugs = load_existing_slugs(conn, cases_table)
+            seen_slugs: set[str] = set()
+
             page = 1
+            next_listing: Future | None = None
             while True:
                 if args.max_pages is not None and page > args.max_pages:
                     break
 
-                entries = fetch_listing_entries(http_session, listing_url, page)
+                if next_listing is not None:
+                    entries = next_listing.result()
+                else:
+                    entries = fetch_listing_entries(http_session, listing_url, page)
+                next_listing = None
+                # Fetch the following listing page while this one is processed.
+                if entries and (args.max_pages is None or page < args.max_pages):
+                    next_listing = listing_pool.submit(fetch_listing_entries, http_session, listing_url, page + 1)
+
                 if not entries:
                     print(f"No entries returned for page {page}. Stopping.")
                     break
 
-                slugs = [entry.slug for entry in entries]
-                existing_slugs = load_existing_slugs(conn, cases_table, slugs)
-
-                new_entries = [entry for entry in entries if entry.slug not in existing_slugs]
+                new_entries = [
+                    entry for entry in entries if entry.slug not in existing_slugs and entry.slug not in seen_slugs
+                ]
 
                 if args.verbose:
+                    new_slugs = {entry.slug for entry in new_entries}
                     for entry in entries:
-                        marker = "*" if entry.slug not in existing_slugs else "-"
+                        marker = "*" if entry.slug in new_slugs else "-"
                         decided = entry.decided_at.isoformat() if entry.decided_at else "?"
                         print(f"{marker} {entry.slug} decided={decided}")
 
                 page_inserted = 0
 
-                for entry in new_entries:
+                # Decision pages are independent, so fetch them concurrently and
+                # keep the database work on this thread.
+                futures = [
+                    (entry, fetch_pool.submit(extract_pdfs_from_decision_page, entry.url, http_session))
+                    for entry in new_entries
+                ]
+                fetched: list[tuple[ListingEntry, dict, list[dict]]] = []
+                for entry, future in futures:
                     try:
-                        result = process_listing_entry(
-                        conn,
-                        entry=entry,
-                        cases_table=cases_table,
-                        documents_table=docs_table,
-                        http_session=http_session,
-                        download_session=download_session,
-                        dry_run=args.dry_run,
-                        export_docs=doc_previews,
-                        export_docs_enabled=export_docs_enabled,
+                        meta, pdfs = future.result()
+                    except Exception as exc:  # noqa: BLE001
+                        print(f"! Error processing {entry.slug}: {exc}")
+                        continue
+                    fetched.append((entry, meta, pdfs))
+
+                case_ids: dict[str, tuple[int, bool]] = {}
+                if fetched and not args.dry_run:
+                    case_ids = upsert_cases(conn, cases_table, [(entry, meta) for entry, meta, _ in fetched])
+
+                # Queue every PDF on the page before collecting any, so downloads
+                # and hashing overlap across cases rather than within one case.
+                pending_cases = []
+                for entry, meta, pdfs in fetched:
+                    if args.dry_run:
+                        case_id = "dry-run"
+                    else:
+                        upserted = case_ids.get(entry.slug)
+                        if upserted is None or not upserted[1]:
+                            seen_slugs.add(entry.slug)
+                            continue
+                        case_id = str(upserted[0])
+                    downloads = submit_downloads(
+                        pdfs,
+                        download_pool=download_pool,
+                        session=http_session,
+                        timeout=args.download_timeout,
+                        enabled=export_docs_enabled or not args.dry_run,
+                        probe_only=args.dry_run,
                     )
+                    pending_cases.append((entry, meta, case_id, downloads))
+
+                staged_docs: list[tuple] = []
+                page_results: list[CaseInsertResult] = []
+                for entry, meta, case_id, downloads in pending_cases:
+                    try:
+                        result = process_listing_entry(
+                            entry=entry,
+                            meta=meta,
+                            case_id=case_id,
+                            downloads=downloads,
+                            dry_run=args.dry_run,
+                            staged_docs=staged_docs,
+                            export_docs=doc_previews,
+                            export_docs_enabled=export_docs_enabled,
+                        )
                     except Exception as exc:  # noqa: BLE001
                         print(f"! Error processing {entry.slug}: {exc}")
-                        conn.rollback()
                         continue
-                    if result:
-                        page_inserted += 1
-                        results.append(result)
-                        doc_count = len(result.documents)
-                        if args.dry_run:
-                            print(f"[dry-run] {entry.slug} ({doc_count} document(s))")
-                        else:
-                            total_inserted += 1
-                            total_docs += doc_count
-                            print(f"+ {entry.slug} ({doc_count} document(s))")
-                    existing_slugs.add(entry.slug)
+                    page_results.append(result)
+                    seen_slugs.add(entry.slug)
+
+                if not args.dry_run:
+                    inserted = flush_documents(conn, doc_sql, staged_docs)
+                    for result in page_results:
+                        result.documents = [url for url in result.documents if (result.case_id, url) in inserted]
+
+                for result in page_results:
+                    page_inserted += 1
+                    results.append(result)
+                    doc_count = len(result.documents)
+                    if args.dry_run:
+                        print(f"[dry-run] {result.case_slug} ({doc_count} document(s))")
+                    else:
+                        total_inserted += 1
+                        total_docs += doc_count
+                        print(f"+ {result.case_slug} ({doc_count} document(s))")
 
                 all_past_cutoff = False
                 if cutoff is not None:
@@ -575,8 +743,10 @@ def main() -> int:
 
             return 0
     finally:
+        listing_pool.shutdown(cancel_futures=True)
+        fetch_pool.shutdown(cancel_futures=True)
+        download_pool.shutdown(cancel_futures=True)
         http_session.close()
-        download_session.close()
 
 
 if __name__ == "__main__":
@@ -26,12 +26,16 @@ import argparse
 import csv
 import json
 import os
+import re
+import signal
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import Iterable, Iterator
+from urllib.parse import urlsplit, urlunsplit
 
 import psycopg
 from psycopg import sql
@@ -42,16 +46,26 @@ if str(ROOT) not in sys.path:
 
 from scraper.session import build_http_session
 from scripts.rescrape_cases import (  # type: ignore
+    connect_db,
     ensure_cursor_table,
     extract_pdfs_from_decision_page,
-    download_pdf,
-    sha256_bytes,
+    download_pdf_sha256,
+    probe_pdf,
 )
 
 DEFAULT_DOCUMENTS_TABLE = "dev.documents"
 DEFAULT_CASES_TABLE = "dev.cases"
 DEFAULT_CURSOR_NAME = "extra_pdfs_progress"
 DEFAULT_BATCH_SIZE = 200
+DEFAULT_CONCURRENCY = 16
+DEFAULT_DOWNLOAD_WORKERS = 4
+DEFAULT_CHECKPOINT_EVERY = 10
+DEFAULT_HTTP_CACHE_PATH = ".cache/extra_pdfs_http"
+
+_DOC_TYPES = frozenset({"reasons", "decision"})
+_SHA256_HEX_RE = re.compile(r"[0-9a-f]{64}")
+# Strong ETags only: a weak (W/) validator says nothing about the bytes.
+_SHA256_ETAG_RE = re.compile(r'"?([0-9a-f]{64})"?')
 
 
 def now_utc() -> datetime:
@@ -90,6 +104,46 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--no-backfill", action="store_true", help="Disable inserts even if not in dry-run mode")
     parser.add_argument("--list-missing", action="store_true", help="Print missing PDF URLs for each hit")
     parser.add_argument("--csv", dest="csv_path", help="Export cases with missing PDFs to CSV")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=int(os.getenv("EXTRA_PDFS_CONCURRENCY", DEFAULT_CONCURRENCY)),
+        help="Decision pages fetched in parallel (keep modest to stay polite to GOV.UK)",
+    )
+    parser.add_argument(
+        "--download-workers",
+        type=int,
+        default=DEFAULT_DOWNLOAD_WORKERS,
+        help="PDFs downloaded in parallel for each case being backfilled",
+    )
+    parser.add_argument(
+        "--trust-url-hash",
+        action="store_true",
+        help="Take sha256 from a 64-hex path segment in the PDF URL instead of downloading (bytes/mime left NULL)",
+    )
+    parser.add_argument(
+        "--trust-etag",
+        action="store_true",
+        help="HEAD each PDF first and take sha256 from an ETag shaped like one, skipping the download",
+    )
+    parser.add_argument(
+        "--skip-if-at-least",
+        type=int,
+        metavar="K",
+        help="Do not fetch the decision page for cases that already have K or more documents",
+    )
+    parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=int(os.getenv("EXTRA_PDFS_CHECKPOINT_EVERY", DEFAULT_CHECKPOINT_EVERY)),
+        help="Persist the cursor every N batches (always saved on exit)",
+    )
+    parser.add_argument(
+        "--http-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=f"Cache decision pages for 7 days in {DEFAULT_HTTP_CACHE_PATH}.sqlite (needs requests-cache)",
+    )
     parser.add_argument("--delay-ms", type=int, default=0, help="Delay between batches to reduce load")
     parser.add_argument("--verbose", action="store_true", help="Log every case, not just hits")
     return parser.parse_args()
@@ -103,6 +157,66 @@ def quote_table(name: str) -> sql.Composed:
     return sql.SQL(".").join(identifiers)
 
 
+# Column order of the rows passed to `copy_documents`.
+DOCUMENT_COPY_COLUMNS = (
+    "case_id",
+    "pdf_url",
+    "sha256",
+    "bytes",
+    "mime",
+    "filename",
+    "document_type",
+    "document_classification_method",
+)
+
+
+@dataclass(frozen=True)
+class DocumentStatements:
+    """SQL for one documents table, composed once per run rather than per call."""
+
+    select_existing: sql.Composed
+    insert: sql.Composed
+    create_staging: sql.Composed
+    copy_staging: sql.Composed
+    merge_staging: sql.Composed
+
+
+def document_statements(documents_table: sql.Composed) -> DocumentStatements:
+    columns = sql.SQL(", ").join(sql.Identifier(name) for name in DOCUMENT_COPY_COLUMNS)
+    return DocumentStatements(
+        select_existing=sql.SQL(
+            "SELECT case_id::text, pdf_url FROM {docs} WHERE case_id = ANY(%s) AND pdf_url IS NOT NULL"
+        ).format(docs=documents_table),
+        insert=sql.SQL(
+            """
+            INSERT INTO {table} (
+              case_id, pdf_url, sha256, bytes, mime, blob_url, filename,
+              downloaded_at, processed, document_type, document_classification_method
+            )
+            VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), FALSE, %s, %s)
+            ON CONFLICT DO NOTHING
+            RETURNING id
+            """
+        ).format(table=documents_table),
+        create_staging=sql.SQL(
+            "CREATE TEMP TABLE staging_documents ON COMMIT DROP AS "
+            "SELECT {columns} FROM {table} WITH NO DATA"
+        ).format(columns=columns, table=documents_table),
+        copy_staging=sql.SQL("COPY staging_documents ({columns}) FROM STDIN").format(columns=columns),
+        merge_staging=sql.SQL(
+            """
+            INSERT INTO {table} (
+              {columns}, blob_url, downloaded_at, processed
+            )
+            SELECT {columns}, NULL, NOW(), FALSE
+            FROM staging_documents
+            ON CONFLICT DO NOTHING
+            RETURNING case_id::text, pdf_url
+            """
+        ).format(table=documents_table, columns=columns),
+    )
+
+
 def ensure_progress(conn: psycopg.Connection, cursor_name: str):
     ensure_cursor_table(conn)
     conn.commit()
@@ -116,21 +230,24 @@ def clear_progress(conn: psycopg.Connection, cursor_name: str):
     conn.commit()
 
 
-def load_progress(conn: psycopg.Connection, cursor_name: str) -> int:
+def load_progress(conn: psycopg.Connection, cursor_name: str) -> tuple[int, str | None]:
+    """Return `(offset, last_id)`; `offset` counts cases processed so far."""
+
     with conn.cursor() as cur:
         cur.execute("SELECT last_seen_slug FROM cursors WHERE name=%s", (cursor_name,))
         row = cur.fetchone()
     if not row or not row[0]:
-        return 0
+        return 0, None
     try:
         data = json.loads(row[0])
-        return int(data.get("offset", 0))
+        last_id = data.get("last_id")
+        return int(data.get("offset", 0)), (str(last_id) if last_id is not None else None)
     except Exception:
-        return 0
+        return 0, None
 
 
-def save_progress(conn: psycopg.Connection, cursor_name: str, offset: int):
-    payload = json.dumps({"offset": offset, "timestamp": now_utc().isoformat()})
+def save_progress(conn: psycopg.Connection, cursor_name: str, offset: int, last_id: str | None):
+    payload = json.dumps({"offset": offset, "last_id": last_id, "timestamp": now_utc().isoformat()})
     with conn.cursor() as cur:
         cur.execute(
             """
@@ -140,46 +257,114 @@ def save_progress(conn: psycopg.Connection, cursor_name: str, offset: int):
             DO UPDATE SET last_seen_slug = EXCLUDED.last_seen_slug, last_run_at = NOW()
             """,
             (cursor_name, payload),
+            prepare=True,
         )
     conn.commit()
 
 
-def fetch_case_batch(
+def _exit_on_sigterm(signum, frame):
+    # Unwind through the `finally` blocks so the last checkpoint is written.
+    raise SystemExit(128 + signum)
+
+
+def resolve_legacy_offset(conn: psycopg.Connection, *, cases_table: sql.Composed, offset: int) -> str | None:
+    """Translate an offset-only cursor from older runs into the last id it covered."""
+
+    if offset <= 0:
+        return None
+    query = sql.SQL(
+        """
+        SELECT id::text
+        FROM {cases}
+        WHERE html_url IS NOT NULL
+        ORDER BY id
+        LIMIT 1 OFFSET %s
+        """
+    ).format(cases=cases_table)
+    with conn.cursor() as cur:
+        cur.execute(query, (offset - 1,))
+        row = cur.fetchone()
+    return row[0] if row else None
+
+
+def estimate_case_count(conn: psycopg.Connection, table_name: str) -> int | None:
+    """Planner row estimate for the cases table; cheap, but only as fresh as the last ANALYZE."""
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)", (table_name,))
+        row = cur.fetchone()
+    # -1 means the table has never been analyzed.
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def iter_case_batches(
     conn: psycopg.Connection,
     *,
     cases_table: sql.Composed,
-    limit: int,
-    offset: int,
-) -> list[CaseRow]:
+    batch_size: int,
+    after_id: str | None,
+) -> Iterator[list[CaseRow]]:
+    """Stream cases after `after_id` in id order, `batch_size` rows at a time.
+
+    The scan runs once through a server-side cursor, so each batch is a single
+    `FETCH FORWARD` rather than a fresh query. The cursor lives in `conn`'s
+    transaction: use a connection that nothing else commits on.
+    """
+
+    keyset = sql.SQL("AND id > %s") if after_id is not None else sql.SQL("")
     query = sql.SQL(
         """
         SELECT id::text, govuk_slug, html_url
         FROM {cases}
-        WHERE html_url IS NOT NULL
+        WHERE html_url IS NOT NULL {keyset}
         ORDER BY id
-        LIMIT %s OFFSET %s
         """
-    ).format(cases=cases_table)
-    with conn.cursor() as cur:
-        cur.execute(query, (limit, offset))
-        rows = cur.fetchall()
-    return [CaseRow(case_id=r[0], slug=r[1], html_url=r[2]) for r in rows]
+    ).format(cases=cases_table, keyset=keyset)
+    params = (after_id,) if after_id is not None else None
+    with conn.cursor(name="extra_pdfs_scan") as cur:
+        cur.execute(query, params)
+        while True:
+            rows = cur.fetchmany(batch_size)
+            if not rows:
+                return
+            yield [CaseRow(case_id=r[0], slug=r[1], html_url=r[2]) for r in rows]
 
 
 def fetch_existing_pdf_urls(
     conn: psycopg.Connection,
-    documents_table: sql.Composed,
-    case_id: str,
-) -> set[str]:
-    query = sql.SQL("SELECT pdf_url FROM {docs} WHERE case_id = %s").format(docs=documents_table)
+    statements: DocumentStatements,
+    case_ids: list[str],
+) -> dict[str, set[str]]:
+    """Return the stored PDF URLs for a whole batch of cases, keyed by case id."""
+
+    existing: dict[str, set[str]] = {case_id: set() for case_id in case_ids}
+    if not case_ids:
+        return existing
     with conn.cursor() as cur:
-        cur.execute(query, (case_id,))
-        return {row[0] for row in cur.fetchall() if row[0]}
+        cur.execute(statements.select_existing, (case_ids,), prepare=True)
+        for case_id, pdf_url in cur:
+            existing.setdefault(case_id, set()).add(pdf_url)
+    return existing
+
+
+def read_case_batch(
+    reader: psycopg.Connection,
+    batches: Iterator[list[CaseRow]],
+    statements: DocumentStatements,
+) -> tuple[list[CaseRow], dict[str, set[str]]] | None:
+    """Next batch from `iter_case_batches` plus its stored PDF URLs, or None when done."""
+
+    cases = next(batches, None)
+    if not cases:
+        return None
+    return cases, fetch_existing_pdf_urls(reader, statements, [case.case_id for case in cases])
 
 
 def insert_document(
     conn: psycopg.Connection,
-    documents_table: sql.Composed,
+    statements: DocumentStatements,
     *,
     case_id: str,
     pdf_url: str,
@@ -190,20 +375,11 @@ def insert_document(
     document_type: str | None,
     classification_method: str,
 ) -> bool:
-    query = sql.SQL(
-        """
-        INSERT INTO {table} (
-          case_id, pdf_url, sha256, bytes, mime, blob_url, filename,
-          downloaded_at, processed, document_type, document_classification_method
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, NOW(), FALSE, %s, %s)
-        ON CONFLICT DO NOTHING
-        RETURNING id
-        """
-    ).format(table=documents_table)
+    """Insert one document row; the caller owns the transaction."""
+
     with conn.cursor() as cur:
         cur.execute(
-            query,
+            statements.insert,
             (
                 case_id,
                 pdf_url,
@@ -215,74 +391,192 @@ def insert_document(
                 document_type,
                 classification_method,
             ),
+            prepare=True,
         )
         row = cur.fetchone()
-    conn.commit()
     return row is not None
 
 
+def copy_documents(
+    conn: psycopg.Connection,
+    statements: DocumentStatements,
+    rows: Iterable[tuple],
+) -> set[tuple[str, str]]:
+    """Insert many document rows via COPY into a staging table.
+
+    Rows follow `DOCUMENT_COPY_COLUMNS`. They are merged with one
+    `INSERT ... SELECT ... ON CONFLICT DO NOTHING` so duplicates are skipped
+    exactly as `insert_document` would; the inserted `(case_id, pdf_url)`
+    pairs are returned, so a URL shared by two cases is attributed to each.
+    The caller owns the transaction.
+    """
+
+    with conn.cursor() as cur:
+        cur.execute(statements.create_staging)
+        with cur.copy(statements.copy_staging) as copy:
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(statements.merge_staging)
+        return set(cur.fetchall())
+
+
+def flush_documents(
+    conn: psycopg.Connection,
+    statements: DocumentStatements,
+    rows: list[tuple],
+) -> set[tuple[str, str]]:
+    """COPY a batch of staged document rows and commit, retrying row by row on failure.
+
+    Either way the batch costs a single commit.
+    """
+
+    if not rows:
+        return set()
+    try:
+        inserted = copy_documents(conn, statements, rows)
+        conn.commit()
+        return inserted
+    except Exception as exc:  # noqa: BLE001
+        print(f"! Bulk document insert failed ({exc}); retrying one row at a time")
+        conn.rollback()
+
+    # One commit for the whole fallback; each row gets a savepoint so a bad
+    # row only discards itself.
+    inserted = set()
+    with conn.transaction():
+        for row in rows:
+            values = dict(zip(DOCUMENT_COPY_COLUMNS, row))
+            try:
+                with conn.transaction():
+                    if insert_document(
+                        conn,
+                        statements,
+                        case_id=values["case_id"],
+                        pdf_url=values["pdf_url"],
+                        sha256_hex=values["sha256"],
+                        bytes_len=values["bytes"],
+                        mime=values["mime"],
+                        filename=values["filename"],
+                        document_type=values["document_type"],
+                        classification_method=values["document_classification_method"],
+                    ):
+                        inserted.add((str(values["case_id"]), values["pdf_url"]))
+            except Exception as exc:  # noqa: BLE001
+                print(f"! Failed to ingest document {values['pdf_url']}: {exc}")
+    return inserted
+
+
 def decide_doc_metadata(pdf: dict) -> tuple[str | None, str]:
     doc_type = pdf.get("document_type")
-    if doc_type in {"reasons", "decision"}:
+    if doc_type in _DOC_TYPES:
         return doc_type, "filename"
     return None, "default"
 
 
+def canonicalize(url: str) -> str:
+    """Comparison key for PDF URLs: lowercase scheme/host, no fragment or trailing `/`."""
+
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, parts.query, ""))
+
+
+def sha256_from_url(url: str) -> str | None:
+    """Return a SHA-256 embedded as a path segment (e.g. `/<sha256>.pdf`), if any."""
+
+    for segment in urlsplit(url).path.split("/"):
+        stem = segment.rsplit(".", 1)[0].lower()
+        if _SHA256_HEX_RE.fullmatch(stem):
+            return stem
+    return None
+
+
+def sha256_from_etag(etag: str | None) -> str | None:
+    match = _SHA256_ETAG_RE.fullmatch(etag.lower()) if etag else None
+    return match.group(1) if match else None
+
+
+def fetch_pdf_digest(url: str, session, *, timeout: float, trust_etag: bool) -> tuple[str, int | None, str]:
+    """Return `(sha256_hex, bytes_len, mime)`, from a HEAD when the ETag is a SHA-256."""
+
+    if trust_etag:
+        bytes_len, mime, etag = probe_pdf(url, session, timeout=timeout)
+        etag_hash = sha256_from_etag(etag)
+        if etag_hash:
+            return etag_hash, bytes_len, mime
+    return download_pdf_sha256(url, session, timeout=timeout)
+
+
 def derive_filename(url: str) -> str | None:
-    return url.split("/")[-1] if url else None
+    return url.rpartition("/")[2] if url else None
 
 
 def process_case(
-    conn: psycopg.Connection,
     *,
-    documents_table: sql.Composed,
     case: CaseRow,
+    decision_page: tuple[dict, list[dict]],
+    existing_urls: set[str],
     http_session,
-    download_session,
+    download_pool: ThreadPoolExecutor,
+    download_timeout: float,
+    staged_docs: list[tuple],
+    trust_url_hash: bool,
+    trust_etag: bool,
     backfill_enabled: bool,
     list_missing: bool,
     dry_run: bool,
 ) -> CaseResult | None:
+    """Compare a case's page with the database and stage rows for missing PDFs.
+
+    Rows are appended to `staged_docs` (see `DOCUMENT_COPY_COLUMNS`) for the
+    batch-level flush; `inserted_urls` on the result lists the staged URLs until
+    the caller narrows it to what was actually inserted.
+    """
+
     html_url = case.html_url
     if not html_url:
         return None
 
-    meta, pdfs = extract_pdfs_from_decision_page(html_url, http_session)
+    meta, pdfs = decision_page
     web_urls = [p["url"] for p in pdfs]
     web_count = len(web_urls)
 
-    existing_urls = fetch_existing_pdf_urls(conn, documents_table, case.case_id)
     db_count = len(existing_urls)
 
-    missing_pdfs = [pdf for pdf in pdfs if pdf["url"] not in existing_urls]
+    # Compare canonical forms so cosmetic differences don't look like a missing
+    # PDF; rows are still inserted with the URL as it appears on the page.
+    existing_canon = {canonicalize(url) for url in existing_urls}
+    missing_pdfs = [pdf for pdf in pdfs if canonicalize(pdf["url"]) not in existing_canon]
     missing_urls = [pdf["url"] for pdf in missing_pdfs]
 
-    inserted_urls: list[str] = []
+    staged_urls: list[str] = []
 
-    if backfill_enabled and missing_urls and web_count >= 2:
+    if backfill_enabled and missing_urls and web_count >= 2 and not dry_run:
+        # Start every download for the case at once, then collect in page order.
+        jobs = []
         for pdf in missing_pdfs:
             url = pdf["url"]
-            if dry_run:
-                continue
-            buf, bytes_len, mime = download_pdf(url, download_session)
-            sha_hex = sha256_bytes(buf)
+            url_hash = sha256_from_url(url) if trust_url_hash else None
+            if url_hash:
+                # Content-addressed URL: satisfy sha256 NOT NULL without a download;
+                # NULL bytes marks the row for later verification.
+                jobs.append((pdf, None, (url_hash, None, None)))
+            else:
+                future = download_pool.submit(
+                    fetch_pdf_digest, url, http_session, timeout=download_timeout, trust_etag=trust_etag
+                )
+                jobs.append((pdf, future, None))
+
+        rows: list[tuple] = []
+        for pdf, future, known in jobs:
+            url = pdf["url"]
+            sha_hex, bytes_len, mime = future.result() if future is not None else known
             document_type, classification_method = decide_doc_metadata(pdf)
             filename = derive_filename(url)
-            inserted = insert_document(
-                conn,
-                documents_table,
-                case_id=case.case_id,
-                pdf_url=url,
-                sha256_hex=sha_hex,
-                bytes_len=bytes_len,
-                mime=mime,
-                filename=filename,
-                document_type=document_type,
-                classification_method=classification_method,
-            )
-            if inserted:
-                inserted_urls.append(url)
-                existing_urls.add(url)
+            rows.append((case.case_id, url, sha_hex, bytes_len, mime, filename, document_type, classification_method))
+        # Only stage once every download for the case has succeeded.
+        staged_docs.extend(rows)
+        staged_urls = [row[1] for row in rows]
 
     if missing_urls and web_count >= 2:
         if list_missing:
@@ -295,40 +589,36 @@ def process_case(
             db_count=db_count,
             web_count=web_count,
             missing_urls=missing_urls,
-            inserted_urls=inserted_urls,
+            inserted_urls=staged_urls,
         )
     return None
 
 
-def maybe_write_csv(path: str, rows: Iterable[CaseResult]):
-    fieldnames = [
-        "case_id",
-        "govuk_slug",
-        "html_url",
-        "db_count",
-        "web_count",
-        "missing_count",
-        "missing_urls",
-        "inserted_count",
-        "inserted_urls",
-    ]
-    with open(path, "w", newline="", encoding="utf-8") as fh:
-        writer = csv.DictWriter(fh, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "case_id": row.case_id,
-                    "govuk_slug": row.slug or "",
-                    "html_url": row.html_url or "",
-                    "db_count": row.db_count,
-                    "web_count": row.web_count,
-                    "missing_count": len(row.missing_urls),
-                    "missing_urls": "\n".join(row.missing_urls),
-                    "inserted_count": len(row.inserted_urls),
-                    "inserted_urls": "\n".join(row.inserted_urls),
-                }
-            )
+CSV_FIELDNAMES = (
+    "case_id",
+    "govuk_slug",
+    "html_url",
+    "db_count",
+    "web_count",
+    "missing_count",
+    "missing_urls",
+    "inserted_count",
+    "inserted_urls",
+)
+
+
+def csv_row(row: CaseResult) -> dict:
+    return {
+        "case_id": row.case_id,
+        "govuk_slug": row.slug or "",
+        "html_url": row.html_url or "",
+        "db_count": row.db_count,
+        "web_count": row.web_count,
+        "missing_count": len(row.missing_urls),
+        "missing_urls": "\n".join(row.missing_urls),
+        "inserted_count": len(row.inserted_urls),
+        "inserted_urls": "\n".join(row.inserted_urls),
+    }
 
 
 def main() -> int:
@@ -337,7 +627,7 @@ def main() -> int:
     if not db_url:
         raise SystemExit("DATABASE_URL is required")
 
-    docs_table = quote_table(args.documents_table)
+    doc_sql = document_statements(quote_table(args.documents_table))
     cases_table = quote_table(args.cases_table)
 
     backfill_enabled = (not args.no_backfill) and (not args.dry_run)
@@ -347,19 +637,24 @@ def main() -> int:
     if backfill_enabled and args.dry_run:
         raise SystemExit("Internal inconsistency: dry-run cannot backfill")
 
-    if backfill_enabled:
-        # We must download bytes to satisfy sha256 NOT NULL
-        download_session = build_http_session(timeout=args.download_timeout)
-    else:
-        download_session = None
-
-    http_session = build_http_session(timeout=args.timeout)
+    # One keep-alive pool for decision pages and PDF downloads (same host),
+    # sized for both worker pools; downloads pass their longer timeout per request.
+    concurrency = max(1, args.concurrency)
+    download_workers = max(1, args.download_workers)
+    http_session = build_http_session(
+        timeout=args.timeout,
+        pool_maxsize=concurrency + download_workers,
+        cache_path=DEFAULT_HTTP_CACHE_PATH if args.http_cache else None,
+    )
+    checkpoint_every = max(1, args.checkpoint_every)
+    skip_at = args.skip_if_at_least
 
     total_cases = 0
     hits = 0
     inserted_docs = 0
     errors = 0
-    exported: list[CaseResult] = []
+    skipped = 0
+    exported = 0
 
     print("========================================")
     print("Starting EXTRA-PDF BACKFILL")
@@ -367,100 +662,182 @@ def main() -> int:
     print(f"Documents table : {args.documents_table}")
     print(f"Cases table     : {args.cases_table}")
     print(f"Batch size      : {args.batch_size}")
+    print(f"Concurrency     : {concurrency}")
+    print(f"Checkpoint every: {checkpoint_every} batch(es)")
+    print(f"Skip if at least: {skip_at if skip_at is not None else 'off'}")
     print(f"Cursor name     : {args.cursor_name}")
     print(f"Dry run         : {args.dry_run}")
     print(f"Backfill        : {backfill_enabled}")
+    print(f"HTTP cache      : {args.http_cache}")
     print(f"CSV export      : {args.csv_path or 'none'}\n")
 
+    # Rows are written as hits come in, so a crash keeps everything found so far.
+    csv_fh = None
+    csv_writer = None
+    if args.csv_path:
+        try:
+            csv_fh = open(args.csv_path, "w", newline="", encoding="utf-8")
+        except OSError as exc:
+            raise SystemExit(f"Cannot open CSV {args.csv_path}: {exc}")
+        csv_writer = csv.DictWriter(csv_fh, fieldnames=CSV_FIELDNAMES)
+        csv_writer.writeheader()
+
     start_ts = time.time()
+    fetch_pool = ThreadPoolExecutor(max_workers=concurrency)
+    download_pool = ThreadPoolExecutor(max_workers=download_workers)
+    signal.signal(signal.SIGTERM, _exit_on_sigterm)
 
     try:
-        with psycopg.connect(db_url) as conn:
-            conn.execute("SET SESSION statement_timeout = '5min';")
+        # Writes and commits go through `conn`; `reader` serves the case scan and
+        # URL lookups and holds the scan's server-side cursor open for the whole
+        # run, so it must not idle out.
+        with connect_db(db_url, statement_timeout="5min") as conn, connect_db(
+            db_url, statement_timeout="5min", idle_in_transaction_timeout="0"
+        ) as reader:
             ensure_progress(conn, args.cursor_name)
 
             if args.reset_cursor:
                 clear_progress(conn, args.cursor_name)
                 print("Cursor reset; starting from offset 0.")
 
-            offset = load_progress(conn, args.cursor_name)
+            offset, last_id = load_progress(conn, args.cursor_name)
+            if last_id is None and offset:
+                last_id = resolve_legacy_offset(conn, cases_table=cases_table, offset=offset)
             if args.limit is not None:
                 print(f"Processing up to {args.limit} case(s) this run starting at offset {offset}.")
             else:
                 print(f"Resuming from offset {offset} (process all remaining cases).")
 
-            # Count total cases once for summary.
-            with conn.cursor() as cur:
-                cur.execute(sql.SQL("SELECT COUNT(*) FROM {cases} WHERE html_url IS NOT NULL").format(cases=cases_table))
-                total_available = int(cur.fetchone()[0])
+            estimate = estimate_case_count(conn, args.cases_table)
+            if estimate:
+                print(f"Cases table holds roughly {estimate} row(s) (planner estimate).")
 
             processed_this_run = 0
-
-            while offset < total_available:
-                if args.limit is not None and processed_this_run >= args.limit:
-                    break
-
-                batch_limit = min(args.batch_size, total_available - offset)
-                if args.limit is not None:
-                    batch_limit = min(batch_limit, args.limit - processed_this_run)
-
-                cases = fetch_case_batch(conn, cases_table=cases_table, limit=batch_limit, offset=offset)
-                if not cases:
-                    break
-
-                for case in cases:
-                    total_cases += 1
-                    processed_this_run += 1
-
-                    if args.verbose:
-                        print(f"Case {case.case_id} ({case.slug})")
-
-                    try:
-                        if download_session is None and backfill_enabled:
-                            raise RuntimeError("Download session not initialised")
-                        result = process_case(
-                            conn,
-                            documents_table=docs_table,
-                            case=case,
-                            http_session=http_session,
-                            download_session=download_session,
-                            backfill_enabled=backfill_enabled,
-                            list_missing=args.list_missing,
-                            dry_run=args.dry_run,
-                        )
-                        if result:
-                            hits += 1
-                            inserted_docs += len(result.inserted_urls)
-                            exported.append(result)
-                            print(f"  + {result.case_id} slug={result.slug}")
-                            print(f"    page     : {result.html_url}")
-                            print(f"    db_count : {result.db_count}")
-                            print(f"    web_count: {result.web_count}")
-                            if result.inserted_urls:
-                                for url in result.inserted_urls:
-                                    print(f"    inserted : {url}")
-                        else:
+            batches_since_save = 0
+            batch_size = args.batch_size if args.limit is None else max(1, min(args.batch_size, args.limit))
+            batches = iter_case_batches(reader, cases_table=cases_table, batch_size=batch_size, after_id=last_id)
+            # Reads run on `reader` in the background: the next batch and its
+            # stored URLs load while this one is fetched, downloaded and flushed.
+            read_pool = ThreadPoolExecutor(max_workers=1)
+            next_batch = read_pool.submit(read_case_batch, reader, batches, doc_sql)
+            try:
+                while next_batch is not None:
+                    loaded = next_batch.result()
+                    next_batch = None
+                    if loaded is None:
+                        break
+                    cases, existing_by_case = loaded
+                    if args.limit is not None:
+                        cases = cases[: args.limit - processed_this_run]
+                        if not cases:
+                            break
+                    if args.limit is None or processed_this_run + len(cases) < args.limit:
+                        next_batch = read_pool.submit(read_case_batch, reader, batches, doc_sql)
+
+                    # Fetch the batch's decision pages concurrently; results are
+                    # consumed (and printed) in order on this thread. Cases that
+                    # already hold enough documents are not fetched at all.
+                    pages = [
+                        None
+                        if skip_at is not None and len(existing_by_case[case.case_id]) >= skip_at
+                        else fetch_pool.submit(extract_pdfs_from_decision_page, case.html_url, http_session)
+                        for case in cases
+                    ]
+
+                    staged_docs: list[tuple] = []
+                    batch_results: list[CaseResult] = []
+                    for case, page in zip(cases, pages):
+                        total_cases += 1
+                        processed_this_run += 1
+
+                        if args.verbose:
+                            print(f"Case {case.case_id} ({case.slug})")
+
+                        if page is None:
+                            skipped += 1
                             if args.verbose:
-                                print("    no extra PDFs")
+                                print(f"    skipped: {len(existing_by_case[case.case_id])} document(s) already stored")
+                            continue
+
+                        try:
+                            result = process_case(
+                                case=case,
+                                decision_page=page.result(),
+                                existing_urls=existing_by_case[case.case_id],
+                                http_session=http_session,
+                                download_pool=download_pool,
+                                download_timeout=args.download_timeout,
+                                staged_docs=staged_docs,
+                                trust_url_hash=args.trust_url_hash,
+                                trust_etag=args.trust_etag,
+                                backfill_enabled=backfill_enabled,
+                                list_missing=args.list_missing,
+                                dry_run=args.dry_run,
+                            )
+                            if result:
+                                batch_results.append(result)
+                            else:
+                                if args.verbose:
+                                    print("    no extra PDFs")
+                        except Exception as exc:  # noqa: BLE001
+                            errors += 1
+                            print(f"  ! Error processing case {case.case_id}: {exc}")
+
+                    # One bulk insert and commit for the whole batch.
+                    if staged_docs:
+                        inserted = flush_documents(conn, doc_sql, staged_docs)
+                        for result in batch_results:
+                            result.inserted_urls = [
+                                url for url in result.inserted_urls if (result.case_id, url) in inserted
+                            ]
+
+                    for result in batch_results:
+                        hits += 1
+                        inserted_docs += len(result.inserted_urls)
+                        if csv_writer is not None:
+                            csv_writer.writerow(csv_row(result))
+                            exported += 1
+                        print(f"  + {result.case_id} slug={result.slug}")
+                        print(f"    page     : {result.html_url}")
+                        print(f"    db_count : {result.db_count}")
+                        print(f"    web_count: {result.web_count}")
+                        if result.inserted_urls:
+                            for url in result.inserted_urls:
+                                print(f"    inserted : {url}")
+                    if csv_fh is not None and batch_results:
+                        csv_fh.flush()
+
+                    offset += len(cases)
+                    last_id = cases[-1].case_id
+                    batches_since_save += 1
+                    if batches_since_save >= checkpoint_every:
+                        save_progress(conn, args.cursor_name, offset, last_id)
+                        batches_since_save = 0
+
+                    if args.delay_ms > 0:
+                        time.sleep(args.delay_ms / 1000.0)
+            finally:
+                read_pool.shutdown(cancel_futures=True)
+                # Completed batches are already committed; only the cursor may lag.
+                if batches_since_save:
+                    try:
+                        conn.rollback()
+                        save_progress(conn, args.cursor_name, offset, last_id)
                     except Exception as exc:  # noqa: BLE001
-                        errors += 1
-                        print(f"  ! Error processing case {case.case_id}: {exc}")
-
-                offset += len(cases)
-                save_progress(conn, args.cursor_name, offset)
-
-                if args.delay_ms > 0:
-                    time.sleep(args.delay_ms / 1000.0)
+                        print(f"⚠️  Failed to save progress at offset {offset}: {exc}")
 
             print("\nProcessed cases this run: ", processed_this_run)
             print("Total cases with extra PDFs uncovered: ", hits)
             print("Documents inserted: ", inserted_docs)
+            print("Skipped (enough documents stored): ", skipped)
             print("Errors: ", errors)
 
     finally:
+        fetch_pool.shutdown(cancel_futures=True)
+        download_pool.shutdown(cancel_futures=True)
         http_session.close()
-        if download_session:
-            download_session.close()
+        if csv_fh is not None:
+            csv_fh.close()
 
     duration = time.time() - start_ts
     print("\n========================================")
@@ -468,16 +845,13 @@ def main() -> int:
     print("========================================")
     print(f"Time taken       : {duration / 60.0:.1f} minutes")
     print(f"Cases processed  : {total_cases}")
+    print(f"Cases skipped    : {skipped}")
     print(f"Cases with extras: {hits}")
     print(f"Docs inserted    : {inserted_docs}")
     print(f"Errors           : {errors}")
 
-    if args.csv_path and exported:
-        try:
-            maybe_write_csv(args.csv_path, exported)
-            print(f"\nExported {len(exported)} case(s) to {args.csv_path}")
-        except Exception as exc:  # noqa: BLE001
-            print(f"\n⚠️  Failed to write CSV {args.csv_path}: {exc}")
+    if args.csv_path:
+        print(f"\nExported {exported} case(s) to {args.csv_path}")
 
     return 0 if errors == 0 else 1
 
@@ -13,7 +13,10 @@ Environment variables (see `.env.example` for defaults):
     BATCH_SIZE            Number of cases processed per page (default 200)
     DELAY_MS              Milliseconds sleep between page batches
     MAX_PAGES             Safety upper bound on pagination
+    FETCH_CONCURRENCY     Decision pages fetched in parallel (default 6)
+    DOWNLOAD_CONCURRENCY  PDFs downloaded in parallel (default 4)
     CURSOR_NAME           Name of progress cursor row (default rescrape_progress)
+    CHECKPOINT_EVERY      Pages between cursor updates (default 5)
     STORE_PDF_BYTES       When "1" download PDF bytes and persist metadata
     ENABLE_BLOB_UPLOAD    When "1" call `upload_to_blob` for external storage
 
@@ -28,17 +31,22 @@ Tables expected in the target database:
 from __future__ import annotations
 
 import hashlib
-import json
 import mimetypes
 import os
 import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 from urllib.parse import urljoin, urlparse
 
+import orjson
 import psycopg
-from bs4 import BeautifulSoup
+from psycopg.conninfo import conninfo_to_dict, make_conninfo
+from lxml import etree
+from lxml import html as lxml_html
 
 from scraper.session import build_http_session
 
@@ -53,6 +61,10 @@ BATCH_SIZE = int(os.environ.get("BATCH_SIZE", "200"))
 DELAY_MS = int(os.environ.get("DELAY_MS", "200"))
 MAX_PAGES = int(os.environ.get("MAX_PAGES", "100000"))
 CURSOR_NAME = os.environ.get("CURSOR_NAME", "rescrape_progress")
+DOWNLOAD_TIMEOUT = 60.0
+CHECKPOINT_EVERY = max(1, int(os.environ.get("CHECKPOINT_EVERY", "5")))
+FETCH_CONCURRENCY = max(1, int(os.environ.get("FETCH_CONCURRENCY", "6")))
+DOWNLOAD_CONCURRENCY = max(1, int(os.environ.get("DOWNLOAD_CONCURRENCY", "4")))
 
 STORE_PDF_BYTES = os.environ.get("STORE_PDF_BYTES", "1") == "1"
 ENABLE_BLOB_UPLOAD = os.environ.get("ENABLE_BLOB_UPLOAD", "0") == "1"
@@ -76,88 +88,160 @@ def sha256_bytes(buf: bytes) -> str:
 
 def normalized_pathname(url: str) -> str:
     try:
-        parsed = urlparse(url)
-        return re.sub(r"/+$", "", parsed.path)
+        return urlparse(url).path.rstrip("/")
     except Exception:  # pragma: no cover - defensive
         return url
 
 
+_REASONS_PATTERN = r"statement of reasons|\breasons\b|decision and reasons|reasons for decision|full reasons"
+_DECISION_PATTERN = r"\bdecision\b|tribunal decision|determination|judgment|judgement"
+_REASONS_RE = re.compile(_REASONS_PATTERN)
+# Both document types in one scan. Reasons is tried first at each position and
+# decision is only a lookahead, so no decision match can swallow the start of a
+# reasons match; the first hit tells which type occurs earliest.
+_CLASSIFY_RE = re.compile(rf"(?P<reasons>{_REASONS_PATTERN})|(?=(?P<decision>{_DECISION_PATTERN}))")
+_FNAME_DECISION_RE = re.compile(r"decision|determination|judge?ment")
+
+
 def classify_document(link_text: str, surrounding_text: str, href: str) -> str:
     """Heuristically assign document type: reasons | decision | unknown."""
 
     text = f"{link_text} {surrounding_text} {href}".lower()
 
-    reasons_patterns = (
-        r"statement of reasons",
-        r"\breasons\b",
-        r"decision and reasons",
-        r"reasons for decision",
-        r"full reasons",
-    )
-    decision_patterns = (
-        r"\bdecision\b",
-        r"tribunal decision",
-        r"determination",
-        r"judgment",
-        r"judgement",
-    )
-
-    if any(re.search(pattern, text) for pattern in reasons_patterns):
-        return "reasons"
-    if any(re.search(pattern, text) for pattern in decision_patterns):
-        return "decision"
+    match = _CLASSIFY_RE.search(text)
+    if match is not None:
+        if match.lastgroup == "reasons":
+            return "reasons"
+        # Reasons outranks decision, so finish the scan from the decision hit.
+        return "reasons" if _REASONS_RE.search(text, match.start()) else "decision"
 
-    fname = href.split("/")[-1].lower()
-    if any(keyword in fname for keyword in ("reasons", "reason")):
+    fname = href.rpartition("/")[2].lower()
+    if "reason" in fname:
         return "reasons"
-    if any(keyword in fname for keyword in ("decision", "determination", "judgment", "judgement")):
+    if _FNAME_DECISION_RE.search(fname):
         return "decision"
 
     return "unknown"
 
 
+# Decision-page lookups, compiled once and evaluated by libxml2.
+_TITLE_XPATH = etree.XPath("(//h1 | //h2)[1]")
+_META_XPATH = etree.XPath("(//meta[@name = $name])[1]")
+_TIME_XPATH = etree.XPath("(//time)[1]")
+_LABEL_TAGS = ("dt", "strong", "b", "span")
+# First dd/span/time/p after the label in document order, its own children included.
+_LABEL_VALUE_XPATH = etree.XPath(
+    "(descendant::*[self::dd or self::span or self::time or self::p]"
+    " | following::*[self::dd or self::span or self::time or self::p])[1]"
+)
+# Anchors whose href ends in ".pdf" (any case); XPath 1.0 has no ends-with().
+_PDF_ANCHOR_XPATH = etree.XPath(
+    "//a[substring(translate(@href, 'PDF', 'pdf'), string-length(@href) - 3) = '.pdf']"
+)
+
+
+# lxml serialises parses that share a parser object, so each fetch thread
+# keeps its own parsers (one per encoding) instead of sharing one.
+_thread_parsers = threading.local()
+
+
+def _html_parser(encoding: Optional[str]) -> lxml_html.HTMLParser:
+    parsers = getattr(_thread_parsers, "by_encoding", None)
+    if parsers is None:
+        parsers = _thread_parsers.by_encoding = {}
+    parser = parsers.get(encoding)
+    if parser is None:
+        parser = parsers[encoding] = lxml_html.HTMLParser(encoding=encoding)
+    return parser
+
+
+def _page_encoding(response) -> Optional[str]:
+    # Only trust a charset the server actually sent; otherwise let libxml2
+    # read the page's own <meta charset>.
+    if "charset=" in response.headers.get("Content-Type", "").lower():
+        return response.encoding
+    return None
+
+
+def _strings_text(element, separator: str = "") -> str:
+    """Stripped text fragments joined with `separator` (BeautifulSoup's `get_text(sep, strip=True)`)."""
+
+    return separator.join(text for text in (part.strip() for part in element.itertext()) if text)
+
+
+_PUBLISHED_LABELS = ("published", "date published")
+_DECISION_LABELS = ("decision", "date decision", "decided", "decision date")
+
+
+def _labelled_dates(doc) -> Tuple[Optional[str], Optional[str]]:
+    """Return `(published, decision_date)` text from the first matching labels."""
+
+    published = decision_date = None
+    # Lazy walk in document order: labels usually sit near the top of the
+    # page, so the loop tends to stop long before the end of the tree.
+    for label in doc.iter(*_LABEL_TAGS):
+        text = _strings_text(label, " ").lower()
+        wants_published = published is None and any(keyword in text for keyword in _PUBLISHED_LABELS)
+        wants_decision = decision_date is None and any(keyword in text for keyword in _DECISION_LABELS)
+        if not (wants_published or wants_decision):
+            continue
+        values = _LABEL_VALUE_XPATH(label)
+        if not values:
+            continue
+        value = _strings_text(values[0], " ")
+        if wants_published:
+            published = value
+        if wants_decision:
+            decision_date = value
+        if published is not None and decision_date is not None:
+            break
+    return published, decision_date
+
+
 def extract_pdfs_from_decision_page(html_url: str, session):
     response = session.get(html_url)
     response.raise_for_status()
 
-    soup = BeautifulSoup(response.text, "html.parser")
+    content = response.content
+    if content.strip():
+        doc = lxml_html.document_fromstring(content, parser=_html_parser(_page_encoding(response)))
+    else:
+        doc = None
+
+    def first(xpath, **variables):
+        if doc is None:
+            return None
+        found = xpath(doc, **variables)
+        return found[0] if found else None
 
-    title_el = soup.find(["h1", "h2"])
-    title = title_el.get_text(strip=True) if title_el else None
+    title_el = first(_TITLE_XPATH)
+    title = _strings_text(title_el) if title_el is not None else None
 
     def get_meta(name: str) -> Optional[str]:
-        tag = soup.find("meta", attrs={"name": name})
-        if tag and tag.get("content"):
-            return tag["content"]
+        tag = first(_META_XPATH, name=name)
+        if tag is not None and tag.get("content"):
+            return tag.get("content")
         return None
 
     category = get_meta("govuk:section")
     subcategory = get_meta("govuk:taxonomy")
 
-    def find_date_like(label_keywords: List[str]) -> Optional[str]:
-        time_tag = soup.find("time")
-        if time_tag and (time_tag.get("datetime") or time_tag.get_text(strip=True)):
-            return time_tag.get("datetime") or time_tag.get_text(strip=True)
-
-        for dt in soup.find_all(["dt", "strong", "b", "span"]):
-            text = dt.get_text(" ", strip=True).lower()
-            if any(keyword in text for keyword in label_keywords):
-                dd = dt.find_next(["dd", "span", "time", "p"])
-                if dd:
-                    return dd.get_text(" ", strip=True)
-        return None
-
-    published = find_date_like(["published", "date published"])
-    decision_date = find_date_like(["decision", "date decision", "decided", "decision date"])
+    # A dated <time> answers both questions; otherwise one walk over the label
+    # elements fills both in, each from the first label that matches it.
+    time_tag = first(_TIME_XPATH)
+    time_value = (time_tag.get("datetime") or _strings_text(time_tag)) if time_tag is not None else None
+    if time_value:
+        published = decision_date = time_value
+    else:
+        published, decision_date = _labelled_dates(doc) if doc is not None else (None, None)
 
     pdfs = []
-    for anchor in soup.find_all("a", href=True):
-        href = anchor["href"]
-        if not href.lower().endswith(".pdf"):
-            continue
+    for anchor in _PDF_ANCHOR_XPATH(doc) if doc is not None else ():
+        href = anchor.get("href")
         pdf_url = urljoin(html_url, href)
-        link_text = anchor.get_text(" ", strip=True)
-        parent_text = anchor.parent.get_text(" ", strip=True) if anchor.parent else link_text
+        link_text = _strings_text(anchor, " ")
+        parent = anchor.getparent()
+        parent_text = _strings_text(parent, " ") if parent is not None else link_text
         document_type = classify_document(link_text, parent_text, href)
         pdfs.append(
             {
@@ -178,14 +262,49 @@ def extract_pdfs_from_decision_page(html_url: str, session):
     return meta, pdfs
 
 
-def download_pdf(url: str, session):
-    response = session.get(url)
+def download_pdf(url: str, session, *, timeout: Optional[float] = None):
+    response = session.get(url, **_timeout_kwargs(timeout))
     response.raise_for_status()
     content = response.content
     mime = response.headers.get("Content-Type") or mimetypes.guess_type(url)[0] or "application/pdf"
     return content, len(content), mime
 
 
+def download_pdf_sha256(url: str, session, *, timeout: Optional[float] = None) -> Tuple[str, int, str]:
+    """Stream a PDF through SHA-256 and return `(sha256_hex, bytes_len, mime)`.
+
+    Unlike `download_pdf` the body is never held in memory, so use this when
+    only the digest and size are needed.
+    """
+
+    with session.get(url, stream=True, **_timeout_kwargs(timeout)) as response:
+        response.raise_for_status()
+        mime = response.headers.get("Content-Type") or mimetypes.guess_type(url)[0] or "application/pdf"
+        digest = hashlib.sha256()
+        bytes_len = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            digest.update(chunk)
+            bytes_len += len(chunk)
+    return digest.hexdigest(), bytes_len, mime
+
+
+def probe_pdf(url: str, session, *, timeout: Optional[float] = None) -> Tuple[Optional[int], str, Optional[str]]:
+    """HEAD a PDF and return `(bytes_len, mime, etag)` without fetching the body."""
+
+    response = session.head(url, allow_redirects=True, **_timeout_kwargs(timeout))
+    response.raise_for_status()
+    length = response.headers.get("Content-Length")
+    bytes_len = int(length) if length and length.isdigit() else None
+    mime = response.headers.get("Content-Type") or mimetypes.guess_type(url)[0] or "application/pdf"
+    return bytes_len, mime, response.headers.get("ETag")
+
+
+def _timeout_kwargs(timeout: Optional[float]) -> dict:
+    # Without an explicit value the session's default timeout applies, which
+    # lets one shared session serve both page fetches and slower downloads.
+    return {"timeout": timeout} if timeout is not None else {}
+
+
 def upload_to_blob(buf: bytes, sha256_hex: str) -> Optional[str]:
     if not ENABLE_BLOB_UPLOAD:
         return None
@@ -196,37 +315,103 @@ def upload_to_blob(buf: bytes, sha256_hex: str) -> Optional[str]:
 # -----------------------------
 # Database helpers (psycopg v3)
 # -----------------------------
-def get_resume_offset(conn) -> int:
+def connect_db(
+    db_url: str,
+    *,
+    statement_timeout: str = "5min",
+    idle_in_transaction_timeout: str | None = None,
+) -> psycopg.Connection:
+    """Open a connection with session settings applied in the startup packet.
+
+    Passing them as libpq `options` saves the extra `SET` round trip that each
+    script used to issue right after connecting.
+    """
+
+    flags = [f"-c statement_timeout={statement_timeout}"]
+    if idle_in_transaction_timeout is not None:
+        flags.append(f"-c idle_in_transaction_session_timeout={idle_in_transaction_timeout}")
+    # Keep any `options` already in the URL (e.g. Neon's `endpoint=...`):
+    # passing `options=` to connect() would replace them rather than add to them.
+    params = conninfo_to_dict(db_url)
+    if params.get("options"):
+        flags.insert(0, params["options"])
+    params["options"] = " ".join(flags)
+    return psycopg.connect(make_conninfo(**params))
+
+
+def get_resume_position(conn) -> Tuple[int, Optional[int]]:
+    """Return `(offset, last_id)` from the cursor row; `offset` counts cases done so far."""
+
     with conn.cursor() as cur:
         cur.execute("SELECT last_seen_slug FROM cursors WHERE name=%s LIMIT 1", (CURSOR_NAME,))
         row = cur.fetchone()
-        if not row or not row[0]:
-            return 0
-        try:
-            data = json.loads(row[0])
-            return int(data.get("offset", 0))
-        except Exception:
-            return 0
+    if not row or not row[0]:
+        return 0, None
+    try:
+        data = orjson.loads(row[0])
+        offset = int(data.get("offset", 0))
+        last_id = data.get("last_id")
+    except Exception:
+        return 0, None
+    if last_id is None and offset:
+        # Cursor written by an offset-only run: find the id it had reached, once.
+        with conn.cursor() as cur:
+            cur.execute(f"SELECT id FROM {CASES_TABLE} ORDER BY id LIMIT 1 OFFSET %s", (offset - 1,))
+            found = cur.fetchone()
+        last_id = found[0] if found else None
+    return offset, last_id
 
 
-def save_progress(conn, offset: int):
-    payload = json.dumps({"offset": offset, "timestamp": now_utc().isoformat()})
+def save_progress(conn, offset: int, last_id: Optional[int]):
+    # orjson writes the aware datetime in the same ISO 8601 form isoformat() did.
+    payload = orjson.dumps({"offset": offset, "last_id": last_id, "timestamp": now_utc()}).decode()
     with conn.cursor() as cur:
-        cur.execute("SELECT id FROM cursors WHERE name=%s LIMIT 1", (CURSOR_NAME,))
-        row = cur.fetchone()
-        if row:
-            cur.execute(
-                "UPDATE cursors SET last_seen_slug=%s, last_run_at=NOW() WHERE id=%s",
-                (payload, row[0]),
-            )
-        else:
-            cur.execute(
-                "INSERT INTO cursors (name, last_seen_slug, last_run_at) VALUES (%s, %s, NOW())",
-                (CURSOR_NAME, payload),
-            )
+        cur.execute(
+            """
+            INSERT INTO cursors (name, last_seen_slug, last_run_at)
+            VALUES (%s, %s, NOW())
+            ON CONFLICT (name)
+            DO UPDATE SET last_seen_slug = EXCLUDED.last_seen_slug, last_run_at = NOW()
+            """,
+            (CURSOR_NAME, payload),
+        )
     conn.commit()
 
 
+def estimate_case_count(conn) -> Optional[int]:
+    """Planner row estimate for the cases table; cheap, but only as fresh as the last ANALYZE."""
+
+    with conn.cursor() as cur:
+        cur.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)", (CASES_TABLE,))
+        row = cur.fetchone()
+    # -1 means the table has never been analyzed.
+    if not row or row[0] is None or row[0] < 0:
+        return None
+    return int(row[0])
+
+
+def fetch_case_page(conn, last_id: Optional[int]) -> List[tuple]:
+    """Next `BATCH_SIZE` cases after `last_id`, by keyset rather than OFFSET.
+
+    Rows are `(id, govuk_slug, html_url, existing_pdf_urls)`: each case comes
+    with the PDF URLs already stored for it, in the same round trip.
+    """
+
+    keyset = "WHERE id > %s" if last_id is not None else ""
+    query = f"""
+        SELECT c.id, c.govuk_slug, c.html_url,
+               ARRAY(SELECT d.pdf_url FROM {BATCH_TABLE} d WHERE d.case_id = c.id AND d.pdf_url IS NOT NULL)
+        FROM (
+          SELECT id, govuk_slug, html_url FROM {CASES_TABLE} {keyset} ORDER BY id LIMIT %s
+        ) c
+        ORDER BY c.id
+    """
+    params = (last_id, BATCH_SIZE) if last_id is not None else (BATCH_SIZE,)
+    with conn.cursor() as cur:
+        cur.execute(query, params, prepare=True)
+        return cur.fetchall()
+
+
 def ensure_cursor_table(conn):
     with conn.cursor() as cur:
         cur.execute(
@@ -251,12 +436,67 @@ def db_counts(conn) -> Tuple[int, int]:
         return cases, documents
 
 
+_CASE_UPSERT_SQL = f"""
+    INSERT INTO {CASES_TABLE} (govuk_slug, html_url, title, category, subcategory, published_at, decision_date)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+    ON CONFLICT (govuk_slug)
+    DO UPDATE SET
+      html_url = EXCLUDED.html_url,
+      title = EXCLUDED.title,
+      category = EXCLUDED.category,
+      subcategory = EXCLUDED.subcategory,
+      published_at = EXCLUDED.published_at,
+      decision_date = EXCLUDED.decision_date,
+      updated_at = NOW()
+    RETURNING id, (xmax = 0) AS inserted
+"""
+
+
+def _case_upsert_params(slug: str, html_url: str, meta: Dict) -> tuple:
+    return (
+        slug,
+        html_url,
+        meta.get("title"),
+        meta.get("category"),
+        meta.get("subcategory"),
+        meta.get("published"),
+        meta.get("decisionDate"),
+    )
+
+
 def upsert_case_meta(conn, slug: str, html_url: str, meta: Dict) -> Tuple[int, bool]:
     with conn.cursor() as cur:
+        cur.execute(_CASE_UPSERT_SQL, _case_upsert_params(slug, html_url, meta))
+        row = cur.fetchone()
+        return int(row[0]), bool(row[1])
+
+
+_CASE_COLUMNS = "govuk_slug, html_url, title, category, subcategory, published_at, decision_date"
+
+
+def upsert_case_metas(conn, cases: List[Tuple[str, str, Dict]]) -> List[bool]:
+    """Upsert `(slug, html_url, meta)` tuples via COPY and one merge; returns the inserted flags.
+
+    A slug repeated within `cases` is written once (last one wins) and counts
+    as an update after its first occurrence, as sequential upserts would.
+    """
+
+    if not cases:
+        return []
+    # ON CONFLICT cannot touch the same row twice in one statement.
+    rows_by_slug = {slug: _case_upsert_params(slug, html_url, meta) for slug, html_url, meta in cases}
+    with conn.cursor() as cur:
+        cur.execute(
+            f"CREATE TEMP TABLE staging_cases ON COMMIT DROP AS "
+            f"SELECT {_CASE_COLUMNS} FROM {CASES_TABLE} WITH NO DATA"
+        )
+        with cur.copy(f"COPY staging_cases ({_CASE_COLUMNS}) FROM STDIN") as copy:
+            for row in rows_by_slug.values():
+                copy.write_row(row)
         cur.execute(
             f"""
-            INSERT INTO {CASES_TABLE} (govuk_slug, html_url, title, category, subcategory, published_at, decision_date)
-            VALUES (%s, %s, %s, %s, %s, %s, %s)
+            INSERT INTO {CASES_TABLE} ({_CASE_COLUMNS})
+            SELECT {_CASE_COLUMNS} FROM staging_cases
             ON CONFLICT (govuk_slug)
             DO UPDATE SET
               html_url = EXCLUDED.html_url,
@@ -266,26 +506,18 @@ def upsert_case_meta(conn, slug: str, html_url: str, meta: Dict) -> Tuple[int, b
               published_at = EXCLUDED.published_at,
               decision_date = EXCLUDED.decision_date,
               updated_at = NOW()
-            RETURNING id, (xmax = 0) AS inserted
-            """,
-            (
-                slug,
-                html_url,
-                meta.get("title"),
-                meta.get("category"),
-                meta.get("subcategory"),
-                meta.get("published"),
-                meta.get("decisionDate"),
-            ),
+            RETURNING govuk_slug, (xmax = 0) AS inserted
+            """
         )
-        row = cur.fetchone()
-        return int(row[0]), bool(row[1])
+        inserted_by_slug = {slug: bool(inserted) for slug, inserted in cur.fetchall()}
+        cur.execute("DROP TABLE staging_cases")
 
-
-def document_exists_for_case(conn, case_id: int, pdf_url: str) -> bool:
-    with conn.cursor() as cur:
-        cur.execute(f"SELECT 1 FROM {BATCH_TABLE} WHERE case_id=%s AND pdf_url=%s LIMIT 1", (case_id, pdf_url))
-        return cur.fetchone() is not None
+    flags: List[bool] = []
+    seen = set()
+    for slug, _, _ in cases:
+        flags.append(inserted_by_slug.get(slug, False) and slug not in seen)
+        seen.add(slug)
+    return flags
 
 
 def insert_document_row(
@@ -327,6 +559,80 @@ def insert_document_row(
         return cur.fetchone() is not None
 
 
+# Column order of the rows passed to `copy_document_rows`.
+DOCUMENT_ROW_COLUMNS = (
+    "case_id",
+    "pdf_url",
+    "sha256",
+    "bytes",
+    "mime",
+    "blob_url",
+    "filename",
+    "document_type",
+    "document_classification_method",
+)
+
+
+def copy_document_rows(conn, rows: List[tuple]) -> set:
+    """COPY document rows into a staging table and merge them with one INSERT.
+
+    Rows follow `DOCUMENT_ROW_COLUMNS`; conflicts are skipped as in
+    `insert_document_row`. Returns the `(case_id, pdf_url)` pairs actually
+    inserted, so a URL shared by two cases counts once for each.
+    """
+
+    columns = ", ".join(DOCUMENT_ROW_COLUMNS)
+    with conn.cursor() as cur:
+        cur.execute(
+            f"CREATE TEMP TABLE staging_documents ON COMMIT DROP AS "
+            f"SELECT {columns} FROM {BATCH_TABLE} WITH NO DATA"
+        )
+        with cur.copy(f"COPY staging_documents ({columns}) FROM STDIN") as copy:
+            for row in rows:
+                copy.write_row(row)
+        cur.execute(
+            f"""
+            INSERT INTO {BATCH_TABLE} ({columns}, downloaded_at, processed)
+            SELECT {columns}, NOW(), FALSE
+            FROM staging_documents
+            ON CONFLICT DO NOTHING
+            RETURNING case_id, pdf_url
+            """
+        )
+        inserted = set(cur.fetchall())
+        cur.execute("DROP TABLE staging_documents")
+    return inserted
+
+
+def build_document_row(case_id: int, pdf: Dict, session) -> tuple:
+    """Download (when enabled) and describe one PDF as a `DOCUMENT_ROW_COLUMNS` row."""
+
+    pdf_url = pdf["url"]
+    doc_type = pdf["document_type"]
+    if doc_type not in {"reasons", "decision"}:
+        doc_type = None
+        classification_method = "default"
+    else:
+        classification_method = "filename"
+
+    sha_hex = None
+    bytes_len = None
+    mime = None
+    blob_url = None
+    _, slash, tail = pdf_url.rpartition("/")
+    filename = tail if slash else None
+
+    if ENABLE_BLOB_UPLOAD:
+        # The upload needs the bytes themselves.
+        buf, bytes_len, mime = download_pdf(pdf_url, session, timeout=DOWNLOAD_TIMEOUT)
+        sha_hex = sha256_bytes(buf)
+        blob_url = upload_to_blob(buf, sha_hex)
+    elif STORE_PDF_BYTES:
+        # Only the digest and size are kept, so hash while streaming.
+        sha_hex, bytes_len, mime = download_pdf_sha256(pdf_url, session, timeout=DOWNLOAD_TIMEOUT)
+    return (case_id, pdf_url, sha_hex, bytes_len, mime, blob_url, filename, doc_type, classification_method)
+
+
 # -----------------------------
 # Main re-scrape job
 # -----------------------------
@@ -353,11 +659,14 @@ def rescrape_and_classify():
 
     start_ts = time.time()
 
-    http_session = build_http_session(timeout=30)
-    download_session = build_http_session(timeout=60)
+    # One keep-alive pool shared by page fetches and downloads (both hit GOV.UK),
+    # sized for both worker pools; downloads pass their longer timeout per
+    # request. 429s and Retry-After are handled by the retry/backoff policy.
+    http_session = build_http_session(timeout=30, pool_maxsize=FETCH_CONCURRENCY + DOWNLOAD_CONCURRENCY)
 
-    with psycopg.connect(DATABASE_URL) as conn:
-        conn.execute("SET SESSION statement_timeout = '10min';")
+    with http_session, connect_db(DATABASE_URL, statement_timeout="10min") as conn, ThreadPoolExecutor(
+        max_workers=FETCH_CONCURRENCY
+    ) as fetch_pool, ThreadPoolExecutor(max_workers=DOWNLOAD_CONCURRENCY) as download_pool:
         ensure_cursor_table(conn)
 
         init_cases, init_docs = db_counts(conn)
@@ -365,139 +674,181 @@ def rescrape_and_classify():
         print(f"  - Cases: {init_cases}")
         print(f"  - Documents: {init_docs}\n")
 
-        start_offset = get_resume_offset(conn)
-        print(f"Resuming from offset: {start_offset}\n")
-
-        with conn.cursor() as cur:
-            cur.execute(f"SELECT COUNT(*) FROM {CASES_TABLE}")
-            total_cases = int(cur.fetchone()[0])
-
-        while page_index < MAX_PAGES:
-            offset = start_offset + page_index * BATCH_SIZE
-
-            if offset >= total_cases:
-                print("No more cases to process. Re-scrape complete!")
-                save_progress(conn, offset)
-                break
-
-            print(f"\n📄 Page {page_index + 1} (offset {offset})")
-            print("─" * 40)
-
-            with conn.cursor() as cur:
-                cur.execute(
-                    f"""
-                    SELECT id, govuk_slug, html_url
-                    FROM {CASES_TABLE}
-                    ORDER BY id
-                    LIMIT %s OFFSET %s
-                    """,
-                    (BATCH_SIZE, offset),
-                )
-                case_rows = cur.fetchall()
-
-            if not case_rows:
-                print("No cases returned. Stopping.")
-                save_progress(conn, offset)
-                break
-
-            page_created = 0
-            page_updated = 0
-            page_docs = 0
-            page_start = time.time()
-
-            for case_id, slug, html_url in case_rows:
-                items_processed += 1
-                try:
-                    meta, pdfs = extract_pdfs_from_decision_page(html_url, http_session)
-
+        offset, last_id = get_resume_position(conn)
+        print(f"Resuming from offset: {offset}\n")
+        estimate = estimate_case_count(conn)
+        if estimate:
+            print(f"Cases table holds roughly {estimate} row(s) (planner estimate).\n")
+
+        def submit_page_fetches(rows):
+            return [
+                (case_id, html_url, fetch_pool.submit(extract_pdfs_from_decision_page, html_url, http_session))
+                for case_id, _, html_url, _ in rows
+            ]
+
+        pages_since_save = 0
+        next_rows = fetch_case_page(conn, last_id)
+        next_pages = submit_page_fetches(next_rows)
+        try:
+            while page_index < MAX_PAGES:
+                case_rows, pages = next_rows, next_pages
+                if not case_rows:
+                    print("No more cases to process. Re-scrape complete!")
+                    break
+                # Start on the next page's decision pages now, so they download
+                # while this page's PDFs are fetched and its rows are written.
+                if page_index + 1 < MAX_PAGES:
+                    next_rows = fetch_case_page(conn, case_rows[-1][0])
+                    next_pages = submit_page_fetches(next_rows)
+                else:
+                    next_rows, next_pages = [], []
+
+                print(f"\n📄 Page {page_index + 1} (offset {offset})")
+                print("─" * 40)
+
+                page_created = 0
+                page_updated = 0
+                page_docs = 0
+                page_start = time.time()
+
+                # Network work runs on the pools; results are consumed in page order
+                # and every database write stays on this thread.
+                fetched = []
+                for case_id, html_url, page in pages:
+                    items_processed += 1
                     try:
-                        _, inserted = upsert_case_meta(conn, normalized_pathname(html_url), html_url, meta)
-                        if inserted:
-                            total_created_cases += 1
-                            page_created += 1
-                            print("+", end="", flush=True)
-                        else:
-                            total_updated_cases += 1
-                            page_updated += 1
-                            print(".", end="", flush=True)
+                        meta, pdfs = page.result()
                     except Exception as exc:  # noqa: BLE001
                         total_errors += 1
-                        print(f"\n  ⚠️  Case upsert error: {exc}")
-                        conn.rollback()
+                        print(f"\n  ❌ Error processing case {case_id} ({html_url}): {exc}")
+                        continue
+                    fetched.append((case_id, html_url, meta, pdfs))
 
+                # Case metadata for the whole page in one batch; savepoints keep a
+                # failure from discarding the rest of the page's work.
+                case_upserts = [(normalized_pathname(html_url), html_url, meta) for _, html_url, meta, _ in fetched]
+                try:
+                    with conn.transaction():
+                        inserted_flags = upsert_case_metas(conn, case_upserts)
+                except Exception as exc:  # noqa: BLE001
+                    print(f"\n  ⚠️  Batch case upsert failed ({exc}); retrying one case at a time")
+                    inserted_flags = []
+                    for slug, html_url, meta in case_upserts:
+                        try:
+                            with conn.transaction():
+                                _, inserted = upsert_case_meta(conn, slug, html_url, meta)
+                        except Exception as case_exc:  # noqa: BLE001
+                            total_errors += 1
+                            print(f"\n  ⚠️  Case upsert error: {case_exc}")
+                            inserted = None
+                        inserted_flags.append(inserted)
+                # Progress marks go out in one write per page rather than one
+                # flushed print per case.
+                for inserted in inserted_flags:
+                    if inserted is None:
+                        continue
+                    if inserted:
+                        total_created_cases += 1
+                        page_created += 1
+                    else:
+                        total_updated_cases += 1
+                        page_updated += 1
+                sys.stdout.write("".join("+" if inserted else "." for inserted in inserted_flags if inserted is not None))
+                sys.stdout.flush()
+
+                existing = {(case_id, url) for case_id, _, _, urls in case_rows for url in urls}
+                downloads = []
+                for case_id, _, _, pdfs in fetched:
                     for pdf in pdfs:
                         pdf_url = pdf["url"]
-                        doc_type = pdf["document_type"]
-                        if doc_type not in {"reasons", "decision"}:
-                            doc_type = None
-                            classification_method = "default"
-                        else:
-                            classification_method = "filename"
-
-                        if document_exists_for_case(conn, case_id, pdf_url):
+                        if (case_id, pdf_url) in existing:
                             continue
+                        existing.add((case_id, pdf_url))
+                        downloads.append((pdf_url, download_pool.submit(build_document_row, case_id, pdf, http_session)))
 
-                        sha_hex = None
-                        bytes_len = None
-                        mime = None
-                        blob_url = None
-                        filename = pdf_url.split("/")[-1] if "/" in pdf_url else None
+                doc_rows = []
+                for pdf_url, download in downloads:
+                    try:
+                        doc_rows.append(download.result())
+                    except Exception as exc:  # noqa: BLE001
+                        total_errors += 1
+                        print(f"\n  ❌ PDF error for {pdf_url}: {exc}")
 
-                        try:
-                            if STORE_PDF_BYTES or ENABLE_BLOB_UPLOAD:
-                                buf, bytes_len, mime = download_pdf(pdf_url, download_session)
-                                sha_hex = sha256_bytes(buf)
-                                if ENABLE_BLOB_UPLOAD:
-                                    blob_url = upload_to_blob(buf, sha_hex)
-                            inserted = insert_document_row(
-                                conn,
-                                case_id=case_id,
-                                pdf_url=pdf_url,
-                                sha256_hex=sha_hex,
-                                bytes_len=bytes_len,
-                                mime=mime,
-                                blob_url=blob_url,
-                                filename=filename,
-                                document_type=doc_type,
-                                classification_method=classification_method,
-                            )
-                            if inserted:
-                                page_docs += 1
-                                total_new_docs += 1
-                                print("📄", end="", flush=True)
-                        except Exception as exc:  # noqa: BLE001
-                            total_errors += 1
-                            print(f"\n  ❌ PDF error for {pdf_url}: {exc}")
-                            conn.rollback()
+                if doc_rows:
+                    try:
+                        with conn.transaction():
+                            inserted_docs = len(copy_document_rows(conn, doc_rows))
+                    except Exception as exc:  # noqa: BLE001
+                        print(f"\n  ⚠️  Bulk document insert failed ({exc}); retrying one row at a time")
+                        inserted_docs = 0
+                        for row in doc_rows:
+                            values = dict(zip(DOCUMENT_ROW_COLUMNS, row))
+                            try:
+                                with conn.transaction():
+                                    if insert_document_row(
+                                        conn,
+                                        case_id=values["case_id"],
+                                        pdf_url=values["pdf_url"],
+                                        sha256_hex=values["sha256"],
+                                        bytes_len=values["bytes"],
+                                        mime=values["mime"],
+                                        blob_url=values["blob_url"],
+                                        filename=values["filename"],
+                                        document_type=values["document_type"],
+                                        classification_method=values["document_classification_method"],
+                                    ):
+                                        inserted_docs += 1
+                            except Exception as row_exc:  # noqa: BLE001
+                                total_errors += 1
+                                print(f"\n  ❌ PDF error for {values['pdf_url']}: {row_exc}")
+                    page_docs += inserted_docs
+                    total_new_docs += inserted_docs
+                    sys.stdout.write("📄" * inserted_docs)
+                    sys.stdout.flush()
+
+                page_time = f"{time.time() - page_start:.1f}"
+                print("")
+                print(
+                    f"  Created: {page_created} | Updated: {page_updated} | "
+                    f"Docs: {page_docs} | Time: {page_time}s"
+                )
 
-                except Exception as exc:  # noqa: BLE001
-                    total_errors += 1
-                    print(f"\n  ❌ Error processing case {case_id} ({html_url}): {exc}")
+                # Only move the position once this page has committed, so the
+                # `finally` below never records a page that was rolled back.
+                page_offset = offset + len(case_rows)
+                page_last_id = case_rows[-1][0]
+                if pages_since_save + 1 >= CHECKPOINT_EVERY:
+                    save_progress(conn, page_offset, page_last_id)
+                    pages_since_save = 0
+                else:
+                    conn.commit()
+                    pages_since_save += 1
+                offset, last_id = page_offset, page_last_id
+                sleep_ms(DELAY_MS)
+
+                if (page_index + 1) % 10 == 0:
+                    elapsed_min = (time.time() - start_ts) / 60.0
+                    rate = items_processed / max(elapsed_min, 1e-6)
+                    print("")
+                    print(f"📊 Progress Report (Page {page_index + 1})")
+                    print(f"  Total created (cases): {total_created_cases}")
+                    print(f"  Total updated (cases): {total_updated_cases}")
+                    print(f"  Total new documents: {total_new_docs}")
+                    print(f"  Total errors: {total_errors}")
+                    print(f"  Time elapsed: {elapsed_min:.1f} minutes")
+                    print(f"  Rate: {rate:.1f} cases/minute")
+
+                page_index += 1
+        finally:
+            for _, _, page in next_pages:
+                page.cancel()
+            # Finished pages are committed; only the cursor row may lag behind.
+            if pages_since_save:
+                try:
                     conn.rollback()
-
-            page_time = f"{time.time() - page_start:.1f}"
-            print("")
-            print(
-                f"  Created: {page_created} | Updated: {page_updated} | "
-                f"Docs: {page_docs} | Time: {page_time}s"
-            )
-
-            save_progress(conn, offset + len(case_rows))
-            sleep_ms(DELAY_MS)
-
-            if (page_index + 1) % 10 == 0:
-                elapsed_min = (time.time() - start_ts) / 60.0
-                rate = items_processed / max(elapsed_min, 1e-6)
-                print("")
-                print(f"📊 Progress Report (Page {page_index + 1})")
-                print(f"  Total created (cases): {total_created_cases}")
-                print(f"  Total updated (cases): {total_updated_cases}")
-                print(f"  Total new documents: {total_new_docs}")
-                print(f"  Total errors: {total_errors}")
-                print(f"  Time elapsed: {elapsed_min:.1f} minutes")
-                print(f"  Rate: {rate:.1f} cases/minute")
-
-            page_index += 1
+                    save_progress(conn, offset, last_id)
+                except Exception as exc:  # noqa: BLE001
+                    print(f"\n  ⚠️  Failed to save progress at offset {offset}: {exc}")
 
         final_cases, final_docs = db_counts(conn)
         total_minutes = (time.time() - start_ts) / 60.0
@@ -0,0 +1,13 @@
+from datetime import datetime
+
+from scraper.dates import parse_date_text
+
+
+def test_parse_date_text_iso_values_ignore_dayfirst():
+    assert parse_date_text("2024-02-05") == datetime(2024, 2, 5)
+    assert parse_date_text("2024-02-05T10:30:00+01:00") == datetime(2024, 2, 5, 10, 30)
+
+
+def test_parse_date_text_falls_back_to_fuzzy_parse():
+    assert parse_date_text("Decided: 7 July 2024") == datetime(2024, 7, 7)
+    assert parse_date_text("not a date") is None
@@ -19,3 +19,33 @@ def test_parse_listing_html_extracts_document():
     doc = docs[0]
     assert doc.document_url == "https://example.org/decisions/sample-case-123.pdf"
     assert doc.case_id in {"LON00/123", "lon00-123", "generated-1"}
+
+
+def test_parse_listing_html_pairs_definition_list_metadata():
+    html = """
+    <article>
+      <a href="/decisions/case.pdf">Case</a>
+      <div class="case-details">
+        <dl>
+          <dt>Case reference</dt><dd>LON/00AB/LSC/2024/0001</dd>
+          <div><dt>Property</dt><dd>1 Example Road</dd></div>
+        </dl>
+      </div>
+    </article>
+    """
+    docs = parse_listing_html(html, "https://example.org/list", "Tribunal")
+    assert docs[0].metadata == {
+        "case_reference": "LON/00AB/LSC/2024/0001",
+        "property": "1 Example Road",
+    }
+
+
+def test_parse_listing_html_case_ref_after_date_like_text():
+    html = """
+    <article>
+      <a href="/decisions/case.pdf">Case</a>
+      <p>Hearing 1 CHI 2023/0045</p>
+    </article>
+    """
+    docs = parse_listing_html(html, "https://example.org/list", "Tribunal")
+    assert docs[0].case_id == "CHI2023/0045"
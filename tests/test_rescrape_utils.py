@@ -1,3 +1,4 @@
+import hashlib
 import threading
 import http.server
 import socketserver
@@ -9,7 +10,10 @@ from scripts.rescrape_cases import (
     normalized_pathname,
     extract_pdfs_from_decision_page,
     download_pdf,
+    download_pdf_sha256,
+    probe_pdf,
 )
+from scripts.find_extra_pdfs import canonicalize, sha256_from_etag, sha256_from_url
 from scraper.session import build_http_session
 
 
@@ -29,6 +33,17 @@ class _TestHandler(http.server.BaseHTTPRequestHandler):
             body = body.encode("utf-8")
         self.wfile.write(body)
 
+    def do_HEAD(self):  # noqa: N802 (BaseHTTPRequestHandler requirements)
+        status, headers, body = self.routes.get(
+            self.path,
+            (404, {"Content-Type": "text/plain"}, b"not found"),
+        )
+        self.send_response(status)
+        for key, value in headers.items():
+            self.send_header(key, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+
     def log_message(self, format, *args):  # noqa: A003 (silence test server logging)
         return
 
@@ -106,6 +121,105 @@ class RescrapeUtilsTestCase(unittest.TestCase):
             self.assertEqual(length, len(pdf_bytes))
             self.assertEqual(mime, "application/pdf")
 
+    def test_extract_page_metadata_via_http(self):
+        html = """
+        <html>
+          <head><meta name="govuk:section" content="Housing"></head>
+          <body>
+            <h1>Case LON/00AB/HMF/2023/0001</h1>
+            <dl>
+              <dt>Published</dt><dd> 3 March 2024 </dd>
+            </dl>
+            <p>See <a href="/docs/Decision.PDF">the decision</a></p>
+          </body>
+        </html>
+        """
+        routes = {"/case": (200, {"Content-Type": "text/html; charset=utf-8"}, html)}
+
+        with run_test_server(routes) as base_url:
+            session = build_http_session(timeout=5)
+            try:
+                meta, pdfs = extract_pdfs_from_decision_page(f"{base_url}/case", session)
+            finally:
+                session.close()
+
+        self.assertEqual(meta["title"], "Case LON/00AB/HMF/2023/0001")
+        self.assertEqual(meta["category"], "Housing")
+        self.assertIsNone(meta["subcategory"])
+        self.assertEqual(meta["published"], "3 March 2024")
+        self.assertEqual(len(pdfs), 1)
+        self.assertEqual(pdfs[0]["url"], f"{base_url}/docs/Decision.PDF")
+        self.assertEqual(pdfs[0]["context_text"], "See the decision")
+        self.assertEqual(pdfs[0]["document_type"], "decision")
+
+    def test_download_pdf_sha256_streams_digest(self):
+        pdf_bytes = b"%PDF-1.4 " + b"x" * 200_000
+        routes = {"/doc.pdf": (200, {"Content-Type": "application/pdf"}, pdf_bytes)}
+
+        with run_test_server(routes) as base_url:
+            session = build_http_session(timeout=5)
+            try:
+                sha_hex, length, mime = download_pdf_sha256(f"{base_url}/doc.pdf", session)
+            finally:
+                session.close()
+
+        self.assertEqual(sha_hex, hashlib.sha256(pdf_bytes).hexdigest())
+        self.assertEqual(length, len(pdf_bytes))
+        self.assertEqual(mime, "application/pdf")
+
+    def test_probe_pdf_reads_headers_only(self):
+        routes = {"/doc.pdf": (200, {"Content-Type": "application/pdf", "ETag": '"abc"'}, b"%PDF-1.4 body")}
+
+        with run_test_server(routes) as base_url:
+            session = build_http_session(timeout=5)
+            try:
+                bytes_len, mime, etag = probe_pdf(f"{base_url}/doc.pdf", session)
+            finally:
+                session.close()
+
+        self.assertEqual(bytes_len, len(b"%PDF-1.4 body"))
+        self.assertEqual(mime, "application/pdf")
+        self.assertEqual(etag, '"abc"')
+
+    def test_canonicalize(self):
+        cases = [
+            ("HTTPS://Assets.Example.COM/media/a.pdf", "https://assets.example.com/media/a.pdf"),
+            ("https://example.com/media/a.pdf/", "https://example.com/media/a.pdf"),
+            ("https://example.com/media/a.pdf#page=2", "https://example.com/media/a.pdf"),
+            ("https://example.com/a.pdf?v=1", "https://example.com/a.pdf?v=1"),
+            ("  https://example.com/a.pdf  ", "https://example.com/a.pdf"),
+            ("https://example.com", "https://example.com/"),
+        ]
+        for url, expected in cases:
+            with self.subTest(url=url):
+                self.assertEqual(canonicalize(url), expected)
+
+    def test_sha256_from_url(self):
+        digest = hashlib.sha256(b"pdf").hexdigest()
+        cases = [
+            (f"https://example.com/media/{digest}.pdf", digest),
+            (f"https://example.com/media/{digest.upper()}/decision.pdf", digest),
+            (f"https://example.com/media/{digest[:-1]}.pdf", None),
+            ("https://example.com/media/decision.pdf", None),
+        ]
+        for url, expected in cases:
+            with self.subTest(url=url):
+                self.assertEqual(sha256_from_url(url), expected)
+
+    def test_sha256_from_etag(self):
+        digest = hashlib.sha256(b"pdf").hexdigest()
+        cases = [
+            (f'"{digest}"', digest),
+            (digest.upper(), digest),
+            (f'W/"{digest}"', None),
+            ('"abc"', None),
+            ("", None),
+            (None, None),
+        ]
+        for etag, expected in cases:
+            with self.subTest(etag=etag):
+                self.assertEqual(sha256_from_etag(etag), expected)
+
 
 if __name__ == "__main__":
     unittest.main()